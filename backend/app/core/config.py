@@ -1,22 +1,23 @@
 """Application configuration helpers."""
 
+import json
+import os
 from functools import lru_cache
 from pathlib import Path
 from typing import List, Union
-import json
 
-from pydantic import Field, HttpUrl, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from dotenv import dotenv_values
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator
 
+ENV_FILE = Path(".env")
 
-class Settings(BaseSettings):
+
+class Settings(BaseModel):
     """Application settings loaded from environment variables and .env file."""
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        extra="ignore",
-    )
+    # Built once per process and shared; frozen so nothing can mutate the singleton,
+    # and defaults are trusted literals that need no re-validation.
+    model_config = ConfigDict(extra="ignore", frozen=True, validate_default=False)
 
     app_env: str = Field(default="development")
     database_dsn: str = Field(
@@ -28,6 +29,11 @@ class Settings(BaseSettings):
     docs_base_url: HttpUrl | None = Field(default=None)
     queue_backend: str = Field(default="sync")
     redis_dsn: str | None = Field(default=None)
+    ingestion_workers: int = Field(
+        default=2,
+        ge=1,
+        description="Documents ingested concurrently (in-process queue threads or arq max_jobs)",
+    )
     claim_extractor: str = Field(
         default="simple", description="simple | spacy | llm"
     )
@@ -50,10 +56,59 @@ class Settings(BaseSettings):
         default=5,
         description="Maximum number of evidence snippets to retrieve per claim",
     )
+    max_claims_per_document: int | None = Field(
+        default=None,
+        ge=1,
+        description="Keep only the N most important sentences per document (spaCy extractor); unset keeps all",
+    )
+    semantic_analysis_max_chars: int = Field(
+        default=50000,
+        ge=0,
+        description="Skip per-sentence semantic analysis for documents at least this long",
+    )
+    semantic_analysis_max_sentences: int = Field(
+        default=200,
+        ge=0,
+        description="Most flagged sentences per document sent to semantic analysis; the rest keep keyword scoring",
+    )
+    ocr_device: str = Field(
+        default="auto",
+        description="auto | cpu | cuda; auto uses CUDA when onnxruntime-gpu exposes CUDAExecutionProvider",
+    )
+    ocr_det_model_path: str | None = Field(
+        default=None, description="Override RapidOCR's text-detection ONNX model (e.g. an int8 copy)"
+    )
+    ocr_cls_model_path: str | None = Field(
+        default=None, description="Override RapidOCR's text-direction classifier ONNX model"
+    )
+    ocr_rec_model_path: str | None = Field(
+        default=None, description="Override RapidOCR's text-recognition ONNX model"
+    )
+    ocr_workers: int | None = Field(
+        default=None,
+        ge=1,
+        description="Processes in the shared pool that OCRs scanned PDF pages; unset uses the CPU count",
+    )
     cors_origins: List[str] = Field(
         default=["https://*.vercel.app", "http://localhost:3000", "http://127.0.0.1:3000"],
         description="List of allowed CORS origins. Supports wildcards like 'https://*.vercel.app'.",
     )
+    frontend_path: str | None = Field(
+        default=None,
+        description="Directory holding the built frontend; skips probing the candidate paths at startup",
+    )
+    static_max_age: int = Field(
+        default=3600,
+        description="Cache-Control max-age (seconds) for unhashed frontend CSS/JS",
+    )
+    debug: bool = Field(
+        default=False,
+        description="Expose the /debug/* filesystem inspection endpoints (deploy debugging)",
+    )
+    debug_startup_fs: bool = Field(
+        default=False,
+        description="Log a filesystem/frontend inventory on every worker start (deploy debugging)",
+    )
 
     @field_validator("cors_origins", mode="before")
     @classmethod
@@ -72,8 +127,45 @@ class Settings(BaseSettings):
         return v
 
 
-@lru_cache
+@lru_cache(maxsize=1)
+def _env_file_values() -> dict[str, str]:
+    """Parse the .env file once per process (values only; os.environ is left untouched)."""
+    return {key: value for key, value in dotenv_values(ENV_FILE).items() if value is not None}
+
+
+# Upper-cased env var name -> field name, computed once from the static schema.
+_ENV_FIELDS = {name.upper(): name for name in Settings.model_fields}
+
+
+def _collect_fields(source: dict[str, str], into: dict[str, str]) -> None:
+    """Copy known settings from `source` in one pass, matching names case-insensitively."""
+    for key, value in source.items():
+        field = _ENV_FIELDS.get(key.upper())
+        if field is not None:
+            into[field] = value
+
+
+def load_settings() -> Settings:
+    """Build settings from the .env file overlaid with the process environment."""
+    data: dict[str, str] = {}
+    _collect_fields(_env_file_values(), data)
+    _collect_fields(os.environ, data)
+    return Settings.model_validate(data)
+
+
+_settings: Settings | None = None
+
+
 def get_settings() -> Settings:
-    """Return a cached settings instance."""
-    return Settings()
+    """Return the process-wide settings instance, loading it on first use."""
+    global _settings
+    if _settings is None:
+        _settings = load_settings()
+    return _settings
+
+
+def reset_settings() -> None:
+    """Drop the cached settings so the next access reloads the environment."""
+    global _settings
+    _settings = None
 
@@ -0,0 +1,111 @@
+"""CORS middleware tuned for the browser traffic hitting this API."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Sequence
+from functools import lru_cache
+
+from starlette.datastructures import Headers
+from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import Response
+
+PreflightKey = tuple[str, str, str | None]
+
+# "https://*.vercel.app" style entries: a scheme, a leading wildcard, then a literal suffix
+_SUFFIX_WILDCARD = re.compile(r"^(https?://)\*(\.[^*]+)$")
+
+
+def _wildcard_regex(patterns: Sequence[str]) -> str | None:
+    """Merge wildcard origins such as ``https://*.vercel.app`` into one anchored alternation."""
+    if not patterns:
+        return None
+    parts = (re.escape(pattern).replace(r"\*", ".*") for pattern in patterns)
+    return "^(?:" + "|".join(parts) + ")$"
+
+
+@lru_cache(maxsize=8)
+def split_origins(
+    origins: tuple[str, ...],
+) -> tuple[tuple[str, ...], tuple[tuple[str, str], ...], str | None]:
+    """Classify allowed origins into exact values, (scheme, suffix) rules and a wildcard regex.
+
+    Cached on the origin tuple so repeated app factories (tests, reloads) reuse the result.
+    """
+    exact: list[str] = []
+    suffix_rules: list[tuple[str, str]] = []
+    wildcards: list[str] = []
+    # Scheme and host are case-insensitive; rules are lowercased here and origins at check time
+    for origin in (origin.lower() for origin in origins):
+        if origin == "*" or "*" not in origin:
+            exact.append(origin)
+        elif match := _SUFFIX_WILDCARD.match(origin):
+            suffix_rules.append((match.group(1), match.group(2)))
+        else:
+            wildcards.append(origin)
+    return tuple(exact), tuple(suffix_rules), _wildcard_regex(wildcards)
+
+
+class CachedCORSMiddleware(CORSMiddleware):
+    """Starlette's CORSMiddleware with precompiled origin checks and pre-rendered preflights.
+
+    ``allow_origins`` may mix exact origins and ``*`` wildcards. Exact origins live in a
+    frozenset, the common ``https://*.example.app`` form becomes a prefix/suffix test,
+    and any other wildcard shares one compiled regex, so most origin checks never reach
+    the regex engine.
+
+    A preflight answer depends only on the Origin, the requested method and the
+    requested headers, and browsers send the same few combinations over and over.
+    Each distinct combination is rendered once and the Response object is replayed
+    afterwards, so an OPTIONS request costs a dict lookup.
+    """
+
+    preflight_cache_size = 512
+    origin_cache_size = 1024
+
+    def __init__(self, app, allow_origins: Sequence[str] = (), **kwargs) -> None:
+        exact, suffix_rules, wildcard_regex = split_origins(tuple(allow_origins))
+        kwargs.setdefault("allow_origin_regex", wildcard_regex)
+        super().__init__(app, allow_origins=exact, **kwargs)
+        self.exact_origins = frozenset(exact)
+        self.suffix_rules = suffix_rules
+        # Deployments see a handful of distinct origins; remember each verdict
+        self._origin_decisions: dict[str, bool] = {}
+        self._preflight_cache: dict[PreflightKey, Response] = {}
+
+    def is_allowed_origin(self, origin: str) -> bool:
+        allowed = self._origin_decisions.get(origin)
+        if allowed is None:
+            allowed = self._check_origin(origin)
+            if len(self._origin_decisions) >= self.origin_cache_size:
+                del self._origin_decisions[next(iter(self._origin_decisions))]
+            self._origin_decisions[origin] = allowed
+        return allowed
+
+    def _check_origin(self, origin: str) -> bool:
+        origin = origin.lower()
+        if self.allow_all_origins or origin in self.exact_origins:
+            return True
+        for scheme, suffix in self.suffix_rules:
+            if (
+                origin.startswith(scheme)
+                and origin.endswith(suffix)
+                and len(origin) >= len(scheme) + len(suffix)
+            ):
+                return True
+        return self.allow_origin_regex is not None and self.allow_origin_regex.fullmatch(origin) is not None
+
+    def preflight_response(self, request_headers: Headers) -> Response:
+        key = (
+            request_headers["origin"],
+            request_headers["access-control-request-method"],
+            request_headers.get("access-control-request-headers"),
+        )
+        response = self._preflight_cache.get(key)
+        if response is None:
+            response = super().preflight_response(request_headers)
+            if len(self._preflight_cache) >= self.preflight_cache_size:
+                # Bounded: evict the oldest entry so arbitrary Origin headers can't grow it
+                del self._preflight_cache[next(iter(self._preflight_cache))]
+            self._preflight_cache[key] = response
+        return response
@@ -1,52 +1,98 @@
 """Database migration utilities."""
 
-from sqlalchemy import inspect, text
-from sqlmodel import Session
+from sqlmodel import SQLModel
 
 from backend.app.db.session import get_engine
 
+# Columns added to `documents` after the initial schema, with their DDL types.
+PROGRESS_COLUMNS = {
+    "ingest_progress": "REAL",
+    "ingest_progress_message": "TEXT",
+}
 
-def migrate_add_progress_columns() -> None:
+
+def _table_columns(engine, table: str) -> set[str]:
+    """Column names of `table` in one round-trip, without building an Inspector."""
+    with engine.connect() as conn:
+        if engine.dialect.name == "sqlite":
+            # PRAGMA rows are (cid, name, type, notnull, dflt_value, pk)
+            rows = conn.exec_driver_sql(f"PRAGMA table_info({table})").fetchall()
+            return {row[1] for row in rows}
+        rows = conn.exec_driver_sql(
+            "SELECT column_name FROM information_schema.columns "
+            "WHERE table_schema = current_schema() AND table_name = %(table)s",
+            {"table": table},
+        ).fetchall()
+        return {row[0] for row in rows}
+
+
+def migrate_add_progress_columns() -> bool:
     """Add ingest_progress and ingest_progress_message columns to documents table if they don't exist."""
     engine = get_engine()
     
     try:
-        inspector = inspect(engine)
-        # Check if table exists
-        if "documents" not in inspector.get_table_names():
-            return  # Table doesn't exist yet, will be created by create_all
-        
-        # Check if columns exist
-        columns = [col["name"] for col in inspector.get_columns("documents")]
+        columns = _table_columns(engine, "documents")
     except Exception:
-        # If inspection fails, try to add columns anyway (will fail gracefully if they exist)
-        columns = []
-    
-    with Session(engine) as session:
-        if "ingest_progress" not in columns:
-            try:
-                session.exec(text("ALTER TABLE documents ADD COLUMN ingest_progress REAL"))
-                session.commit()
-                print("✅ Added ingest_progress column")
-            except Exception as e:
-                # Column might already exist or table doesn't exist
-                if "duplicate column" not in str(e).lower() and "no such table" not in str(e).lower():
-                    print(f"⚠️  Could not add ingest_progress: {e}")
-                session.rollback()
-        
-        if "ingest_progress_message" not in columns:
-            try:
-                session.exec(text("ALTER TABLE documents ADD COLUMN ingest_progress_message TEXT"))
-                session.commit()
-                print("✅ Added ingest_progress_message column")
-            except Exception as e:
-                # Column might already exist or table doesn't exist
-                if "duplicate column" not in str(e).lower() and "no such table" not in str(e).lower():
-                    print(f"⚠️  Could not add ingest_progress_message: {e}")
-                session.rollback()
-
-
-def run_migrations() -> None:
-    """Run all pending migrations."""
-    migrate_add_progress_columns()
+        # If the lookup fails, try to add columns anyway (will fail gracefully if they exist)
+        columns = set()
+    else:
+        if not columns:
+            return True  # Table doesn't exist yet, will be created by create_all
+
+    missing = {name: ddl for name, ddl in PROGRESS_COLUMNS.items() if name not in columns}
+    if not missing:
+        return True  # Already migrated - the common case on every startup
+
+    # One transaction for all ALTERs so the migration costs a single commit/fsync
+    try:
+        with engine.begin() as conn:
+            for name, ddl in missing.items():
+                conn.exec_driver_sql(f"ALTER TABLE documents ADD COLUMN {name} {ddl}")
+        print(f"✅ Added columns: {', '.join(missing)}")
+    except Exception as e:
+        # Column might already exist or table doesn't exist
+        if "duplicate column" not in str(e).lower() and "no such table" not in str(e).lower():
+            print(f"⚠️  Could not add progress columns: {e}")
+            return False
+    return True
+
+
+def migrate_create_missing_indexes() -> bool:
+    """Create declared indexes that predate their table (create_all skips existing tables)."""
+    engine = get_engine()
+    try:
+        with engine.begin() as conn:
+            for table in SQLModel.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(bind=conn, checkfirst=True)
+    except Exception as e:
+        print(f"⚠️  Could not create indexes: {e}")
+        return False
+    return True
+
+
+def migrate_drop_redundant_id_indexes() -> bool:
+    """Drop the extra unique/index structures older schemas kept next to each primary key."""
+    engine = get_engine()
+    try:
+        with engine.begin() as conn:
+            for table in SQLModel.metadata.sorted_tables:
+                conn.exec_driver_sql(f"DROP INDEX IF EXISTS ix_{table.name}_id")
+                if engine.dialect.name == "postgresql":
+                    conn.exec_driver_sql(
+                        f"ALTER TABLE {table.name} DROP CONSTRAINT IF EXISTS {table.name}_id_key"
+                    )
+    except Exception as e:
+        print(f"⚠️  Could not drop redundant id indexes: {e}")
+        return False
+    return True
+
 
+def run_migrations() -> bool:
+    """Run all pending migrations; False if any of them failed (each logs its own error)."""
+    results = [
+        migrate_add_progress_columns(),
+        migrate_drop_redundant_id_indexes(),
+        migrate_create_missing_indexes(),
+    ]
+    return all(results)
@@ -1,23 +1,45 @@
 """SQLModel definitions for documents, claims, and evidence records."""
 
+import os
+import time
 from datetime import datetime, timezone
+from functools import partial
 from typing import Optional
-from uuid import uuid4
 
-from sqlalchemy import Column, JSON, String
+import numpy as np
+from sqlalchemy import Column, Index, JSON, LargeBinary, String, func
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, Relationship, SQLModel
 
+# Binary, indexable jsonb on Postgres; plain JSON text everywhere else.
+_JSON_TYPE = JSON().with_variant(JSONB, "postgresql")
 
-def utc_now() -> datetime:
-    return datetime.now(timezone.utc)
+
+# Bound once so timestamp defaults dispatch straight to datetime.now in C.
+_UTC_NOW = partial(datetime.now, timezone.utc)
+
+
+def _ulid_hex() -> str:
+    """Primary-key factory: 32-char hex ULID (48-bit ms timestamp + 80 random bits).
+
+    Time-ordered ids append to the right edge of the primary-key B-tree instead of
+    scattering inserts across random leaf pages the way uuid4 does.
+    """
+    return (time.time_ns() // 1_000_000).to_bytes(6, "big").hex() + os.urandom(10).hex()
 
 
 class TimestampMixin(SQLModel):
-    created_at: datetime = Field(default_factory=utc_now, nullable=False)
+    # The database stamps rows written outside the ORM (bulk Core inserts, raw SQL);
+    # ORM objects keep the aware Python value so they stay ordered sub-second.
+    created_at: datetime = Field(
+        default_factory=_UTC_NOW,
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now()},
+    )
     updated_at: datetime = Field(
-        default_factory=utc_now,
+        default_factory=_UTC_NOW,
         nullable=False,
-        sa_column_kwargs={"onupdate": utc_now},
+        sa_column_kwargs={"server_default": func.now(), "onupdate": _UTC_NOW},
     )
 
 
@@ -53,8 +75,8 @@ class Document(DocumentBase, TimestampMixin, table=True):
     __tablename__ = "documents"
 
     id: str = Field(
-        default_factory=lambda: str(uuid4()),
-        sa_column=Column(String, primary_key=True, unique=True, index=True),
+        default_factory=_ulid_hex,
+        sa_column=Column(String(32), primary_key=True),
     )
 
     claims: list["Claim"] = Relationship(back_populates="document")
@@ -71,24 +93,41 @@ class ClaimBase(SQLModel):
     )
     rationale: str | None = Field(default=None)
     score: float | None = Field(default=None)
-    embedding: Optional[list[float]] = Field(
+    embedding: Optional[bytes] = Field(
         default=None,
-        sa_column=Column(JSON),
-        description="Optional dense embedding stored as JSON until pgvector is wired.",
+        sa_column=Column(LargeBinary),
+        description="Optional dense embedding packed as little-endian float32 until pgvector is wired.",
     )
     metadata_json: dict | None = Field(
         default=None,
-        sa_column=Column(JSON),
+        sa_column=Column(_JSON_TYPE),
         description="Extractor metadata such as prompt version or confidence.",
     )
 
+    @property
+    def embedding_np(self) -> np.ndarray | None:
+        """Zero-copy float32 view over the packed embedding."""
+        if self.embedding is None:
+            return None
+        return np.frombuffer(self.embedding, dtype="<f4")
+
+    def set_embedding(self, vector) -> None:
+        """Pack a vector (list or ndarray) into the float32 embedding column."""
+        self.embedding = None if vector is None else np.asarray(vector).astype("<f4").tobytes()
+
 
 class Claim(ClaimBase, TimestampMixin, table=True):
     __tablename__ = "claims"
+    # Serves document_id lookups (leading column) and per-document listing by creation time;
+    # the verdict/score index covers the per-document results aggregation.
+    __table_args__ = (
+        Index("ix_claims_doc_created", "document_id", "created_at"),
+        Index("ix_claims_doc_verdict_score", "document_id", "verdict", "score"),
+    )
 
     id: str = Field(
-        default_factory=lambda: str(uuid4()),
-        sa_column=Column(String, primary_key=True, unique=True, index=True),
+        default_factory=_ulid_hex,
+        sa_column=Column(String(32), primary_key=True),
     )
     document_id: str = Field(
         foreign_key="documents.id",
@@ -120,7 +159,7 @@ class EvidenceBase(SQLModel):
     )
     metadata_json: dict | None = Field(
         default=None,
-        sa_column=Column(JSON),
+        sa_column=Column(_JSON_TYPE),
         description="Additional structured metadata (page, paragraph, topic tags, etc.).",
     )
 
@@ -129,12 +168,13 @@ class Evidence(EvidenceBase, TimestampMixin, table=True):
     __tablename__ = "evidence"
 
     id: str = Field(
-        default_factory=lambda: str(uuid4()),
-        sa_column=Column(String, primary_key=True, unique=True, index=True),
+        default_factory=_ulid_hex,
+        sa_column=Column(String(32), primary_key=True),
     )
     claim_id: str = Field(
         foreign_key="claims.id",
         nullable=False,
+        index=True,
         description="FK to associated claim.",
     )
 
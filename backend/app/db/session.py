@@ -1,21 +1,52 @@
 """SQLModel session and engine helpers."""
 
+import atexit
+import hashlib
 import os
 from collections.abc import Generator
+from pathlib import Path
 
-from sqlalchemy import event
+import orjson
+from sqlalchemy import Table, event
 from sqlmodel import Session, SQLModel, create_engine
 
+
+def _json_serializer(value) -> str:
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
+def _is_sqlite_memory(dsn: str) -> bool:
+    return dsn in ("sqlite://", "sqlite:///") or ":memory:" in dsn or "mode=memory" in dsn
+
+
 def _build_engine(dsn: str):
     connect_args = {}
+    pool_kwargs = {}
     if dsn.startswith("sqlite"):
         # Allow SQLite connections across threads (needed for background jobs)
         connect_args = {"check_same_thread": False}
+        # A few persistent connections: each keeps its page cache warm across sessions and
+        # runs the connect pragmas once, not per checkout. SQLite serializes writers
+        # anyway, so a larger pool would only queue on the write lock.
+        # In-memory databases keep the default pool so the data outlives a checkout.
+        if not _is_sqlite_memory(dsn):
+            pool_kwargs = {"pool_size": 5, "max_overflow": 5}
+    else:
+        pool_kwargs = {
+            "pool_size": int(os.getenv("DB_POOL_SIZE", "20")),
+            "max_overflow": 10,
+            "pool_recycle": 1800,
+        }
     engine = create_engine(
         dsn,
-        pool_pre_ping=True,
+        # A local SQLite file can't drop a connection the way a server can
+        pool_pre_ping=not dsn.startswith("sqlite"),
         echo=False,
         connect_args=connect_args,
+        # orjson's C codec replaces stdlib json for every metadata_json column
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
+        **pool_kwargs,
     )
     if dsn.startswith("sqlite"):
         @event.listens_for(engine, "connect")
@@ -24,6 +55,12 @@ def _build_engine(dsn: str):
             cursor.execute("PRAGMA journal_mode=WAL;")
             cursor.execute("PRAGMA synchronous=NORMAL;")
             cursor.execute("PRAGMA busy_timeout=5000;")
+            # Map up to 256 MiB of the file, and give each pooled connection a 64 MiB page cache
+            # that stays warm between sessions
+            cursor.execute("PRAGMA mmap_size=268435456;")
+            cursor.execute("PRAGMA cache_size=-65536;")
+            cursor.execute("PRAGMA temp_store=MEMORY;")
+            cursor.execute("PRAGMA foreign_keys=ON;")
             cursor.close()
     return engine
 
@@ -39,19 +76,87 @@ def get_engine():
 
             dsn = get_settings().database_dsn
         _engine = _build_engine(dsn)
+        # Close pooled connections on exit so SQLite checkpoints and removes its -wal/-shm files
+        atexit.register(_engine.dispose)
     return _engine
 
 
+def __getattr__(name: str):
+    """Resolve `from backend.app.db.session import engine` lazily (PEP 562).
+
+    Importing this module never builds the engine; only the first attribute
+    access does, so code paths that never touch the database skip pool setup.
+    """
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Tables emitted by the current create_all() call, filled by the DDL listener below.
+_created_tables: set[str] = set()
+
+
+@event.listens_for(Table, "after_create")
+def _record_created_table(target, connection, **kw) -> None:
+    _created_tables.add(target.name)
+
+
+def _schema_fingerprint() -> str:
+    """Short hash of the declared tables, columns and indexes."""
+    schema = sorted(
+        (
+            name,
+            tuple(sorted(column.name for column in table.columns)),
+            tuple(sorted(index.name or "" for index in table.indexes)),
+        )
+        for name, table in SQLModel.metadata.tables.items()
+    )
+    return hashlib.blake2b(repr(schema).encode(), digest_size=8).hexdigest()
+
+
+def _schema_marker(engine) -> Path | None:
+    """Marker file next to a SQLite database recording the schema already applied to it."""
+    url = engine.url
+    if url.get_backend_name() != "sqlite" or not url.database or url.database == ":memory:":
+        return None
+    db_path = Path(url.database)
+    return db_path.with_name(f"{db_path.name}.schema-{_schema_fingerprint()}")
+
+
 def init_db() -> None:
-    """Create database tables if they do not exist and run migrations."""
-    SQLModel.metadata.create_all(bind=get_engine())
-    # Run migrations for schema updates
-    try:
-        from backend.app.db.migrations import run_migrations
-        run_migrations()
-    except Exception as e:
-        # Migration failures are non-fatal in development
-        print(f"⚠️  Migration warning: {e}")
+    """Create database tables if they do not exist and run migrations.
+
+    Skipped when SKIP_DB_INIT=1, or for SQLite when a marker shows the current
+    schema was already applied, so hot restarts avoid the per-table existence checks.
+    """
+    if os.environ.get("SKIP_DB_INIT") == "1":
+        return
+    engine = get_engine()
+    marker = _schema_marker(engine)
+    if marker is not None and marker.exists() and Path(engine.url.database).exists():
+        return
+
+    _created_tables.clear()
+    SQLModel.metadata.create_all(bind=engine)
+    # Tables created just now already match the models; only pre-existing ones can
+    # lag behind, so a fresh database never pays for importing the migrations module.
+    if not _created_tables.issuperset(SQLModel.metadata.tables):
+        try:
+            from backend.app.db.migrations import run_migrations
+            migrated = run_migrations()
+        except Exception as e:
+            # Migration failures are non-fatal in development
+            print(f"⚠️  Migration warning: {e}")
+            migrated = False
+        if not migrated:
+            return  # No marker, so the next startup retries
+
+    if marker is not None:
+        # Markers for earlier schemas are stale now; keep only the current one
+        for stale in marker.parent.glob(f"{Path(engine.url.database).name}.schema-*"):
+            if stale != marker:
+                stale.unlink(missing_ok=True)
+        marker.touch()
 
 
 def get_session() -> Generator[Session, None, None]:
@@ -1,17 +1,23 @@
+import asyncio
 import logging
+import os
 import sys
+import time
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
 
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import ORJSONResponse, Response
+from sqlalchemy import text
 
-from backend.app.db.session import init_db
+from backend.app.db.session import get_engine, init_db
 from backend.app.routes.documents import router as documents_router
 from backend.app.routes.evidence import router as evidence_router
 from backend.app.core.config import get_settings
+from backend.app.core.cors import CachedCORSMiddleware
+from backend.app.core.static import CachedStaticFiles
+from backend.app.services.ingestion import warm_ocr_engine
 
 # Configure logging to show INFO level messages
 logging.basicConfig(
@@ -22,10 +28,133 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    init_db()
-    # Comprehensive frontend status logging on startup
+FRONTEND_ASSETS = ("index.html", "styles.css", "app.js")
+
+# Load balancers probe /healthz constantly; serve the same bytes every time
+_HEALTH_RESPONSE = Response(
+    content=b'{"status":"ok"}',
+    media_type="application/json",
+    headers={"Cache-Control": "no-store"},
+)
+_INTERNAL_ERROR_RESPONSE = Response(
+    content=b'{"detail":"Internal server error"}',
+    status_code=500,
+    media_type="application/json",
+)
+
+
+@lru_cache(maxsize=1)
+def discover_frontend() -> tuple[Path | None, tuple[dict, ...]]:
+    """Locate the frontend bundle once per process (works in both local and Docker).
+
+    Returns the directory holding index.html, or None, plus what was checked on the way.
+    A configured FRONTEND_PATH is trusted as-is, so workers skip the probing entirely.
+    """
+    configured = get_settings().frontend_path
+    if configured:
+        logger.info(f"Using configured frontend path: {configured}")
+        return Path(configured), ({"original": configured, "configured": True},)
+
+    current_dir = Path.cwd()
+    possible_paths = [
+        Path(__file__).parent.parent.parent / "frontend",  # Local: backend/app/main.py -> backend -> project root -> frontend
+        Path("/app/frontend"),  # Docker container (WORKDIR is /app)
+        current_dir / "frontend",  # Relative to current working directory
+    ]
+
+    checked_paths_info = []
+    frontend_path = None
+    for path in possible_paths:
+        # One listing per candidate answers "exists", "has index.html" and "what's inside"
+        try:
+            contents = sorted(os.listdir(path))
+            exists = True
+        except FileNotFoundError:
+            contents, exists = [], False
+        except OSError as e:
+            contents, exists = [f"error: {str(e)}"], path.exists()
+        has_index = "index.html" in contents
+        info = {
+            "original": str(path),
+            "resolved": str(path),
+            "exists": exists,
+            "has_index": has_index,
+            "contents": contents,
+        }
+        checked_paths_info.append(info)
+        logger.info(f"Checking frontend path: {path} (exists: {exists}, has_index: {has_index})")
+
+        if frontend_path is None and has_index:
+            frontend_path = path
+            logger.info(f"✓ Found frontend at: {path}")
+            # Stat the bundle once here so a broken image is obvious in the startup log
+            info["assets"] = {}
+            for asset in FRONTEND_ASSETS:
+                try:
+                    info["assets"][asset] = os.stat(path / asset).st_size
+                except OSError:
+                    logger.error(f"Frontend asset missing: {path / asset}")
+
+    return frontend_path, tuple(checked_paths_info)
+
+
+_DB_CHECK_TTL = 1.0
+_db_ok_until = 0.0
+
+
+def check_database() -> str:
+    """Return "ok" or the error text; a success is reused for a second so tight probe loops skip the DB."""
+    global _db_ok_until
+    now = time.monotonic()
+    if now < _db_ok_until:
+        return "ok"
+    try:
+        with get_engine().connect() as conn:
+            conn.execute(text("SELECT 1"))
+    except Exception as e:
+        return f"error: {str(e)}"
+    _db_ok_until = now + _DB_CHECK_TTL
+    return "ok"
+
+
+def scan_tree(root: Path, max_depth: int) -> dict | str:
+    """Nested ``{name: subtree}`` listing of ``root``; files map to their own name.
+
+    Walks iteratively with os.scandir, whose entries carry the file type from
+    readdir, so each directory costs one listing instead of a stat per child.
+    Directories at the depth limit, or with nothing in them, show as "empty".
+    """
+    tree: dict = {}
+    # (directory, its node, parent node, name in parent, depth of its entries)
+    pending = [(root, tree, None, None, 1)]
+    while pending:
+        path, node, parent, name, depth = pending.pop()
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if depth + 1 < max_depth:
+                            child: dict = {}
+                            node[entry.name] = child
+                            pending.append((entry.path, child, node, entry.name, depth + 1))
+                        else:
+                            node[entry.name] = "empty"
+                    elif entry.is_file():
+                        node[entry.name] = entry.name
+        except PermissionError:
+            if parent is None:
+                return "permission_denied"
+            parent[name] = "permission_denied"
+            continue
+        if not node:
+            if parent is None:
+                return "empty"
+            parent[name] = "empty"
+    return tree
+
+
+def log_startup_filesystem() -> None:
+    """Comprehensive frontend status logging, for debugging container layouts."""
     current_dir = Path.cwd()
     frontend_docker = Path("/app/frontend")
     frontend_local = current_dir / "frontend"
@@ -42,9 +171,10 @@ async def lifespan(app: FastAPI):
     if app_dir.exists():
         logger.info(f"/app directory exists. Contents:")
         try:
-            for item in sorted(app_dir.iterdir()):
-                item_type = "DIR" if item.is_dir() else "FILE"
-                logger.info(f"  [{item_type}] {item.name}")
+            with os.scandir(app_dir) as entries:
+                for entry in sorted(entries, key=lambda e: e.name):
+                    item_type = "DIR" if entry.is_dir() else "FILE"
+                    logger.info(f"  [{item_type}] {entry.name}")
         except Exception as e:
             logger.error(f"Error listing /app: {e}")
     else:
@@ -58,8 +188,8 @@ async def lifespan(app: FastAPI):
     if frontend_docker.exists():
         logger.info(f"  /app/frontend contents:")
         try:
-            for item in sorted(frontend_docker.iterdir()):
-                logger.info(f"    - {item.name}")
+            for name in sorted(os.listdir(frontend_docker)):
+                logger.info(f"    - {name}")
         except Exception as e:
             logger.error(f"  Error listing /app/frontend: {e}")
     else:
@@ -69,12 +199,41 @@ async def lifespan(app: FastAPI):
     if frontend_local.exists():
         logger.info(f"  {current_dir}/frontend contents:")
         try:
-            for item in sorted(frontend_local.iterdir()):
-                logger.info(f"    - {item.name}")
+            for name in sorted(os.listdir(frontend_local)):
+                logger.info(f"    - {name}")
         except Exception as e:
             logger.error(f"  Error listing {current_dir}/frontend: {e}")
     
     logger.info("=" * 60)
+
+
+def ensure_storage_dirs(settings) -> None:
+    """Create the upload and processed-text directories the services write into."""
+    for directory in (settings.ingest_bucket_path, settings.processed_text_path):
+        Path(directory).mkdir(parents=True, exist_ok=True)
+
+
+def warm_gpu_ocr() -> None:
+    """Pay CUDA initialisation for the OCR models at startup instead of in the first upload."""
+    try:
+        warm_ocr_engine()
+    except Exception as exc:
+        logger.warning("OCR_DEVICE=cuda but the OCR engine could not be warmed up: %s", exc)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    settings = get_settings()
+    # Independent blocking setup runs side by side in worker threads
+    setup = [
+        asyncio.to_thread(init_db),
+        asyncio.to_thread(ensure_storage_dirs, settings),
+    ]
+    if settings.ocr_device.lower() == "cuda":
+        setup.append(asyncio.to_thread(warm_gpu_ocr))
+    await asyncio.gather(*setup)
+    if settings.debug_startup_fs:
+        log_startup_filesystem()
     yield
 
 
@@ -87,288 +246,176 @@ def create_app() -> FastAPI:
         version="0.1.0",
         description="Prototype API for ingestion, retrieval, and verification services.",
         lifespan=lifespan,
+        # orjson encodes claim/evidence payloads (floats, metadata dicts) in C
+        default_response_class=ORJSONResponse,
     )
     
     # Add exception handler for unhandled errors
     @app.exception_handler(Exception)
     async def global_exception_handler(request, exc):
-        logger.error(f"Unhandled exception: {str(exc)}", exc_info=True)
-        from fastapi.responses import JSONResponse
-        return JSONResponse(
-            status_code=500,
-            content={"detail": f"Internal server error: {str(exc)}"}
-        )
+        # Details go to the log only; clients get the same fixed body every time
+        logger.error("Unhandled exception on %s %s", request.method, request.url.path, exc_info=exc)
+        return _INTERNAL_ERROR_RESPONSE
 
     # CORS configuration - MUST be added LAST (outermost layer)
-    # Filter out wildcard patterns from exact origins
-    exact_origins = [origin for origin in settings.cors_origins if "*" not in origin]
-    # Extract wildcard patterns for regex matching
-    wildcard_patterns = [origin for origin in settings.cors_origins if "*" in origin]
-    
-    # Convert wildcard patterns to regex (e.g., "https://*.vercel.app" -> r"https://.*\.vercel\.app")
-    origin_regex_patterns = []
-    for pattern in wildcard_patterns:
-        # Convert wildcard to regex: escape dots, replace * with .*
-        regex = pattern.replace(".", r"\.").replace("*", ".*")
-        origin_regex_patterns.append(regex)
-    
-    # Combine regex patterns if any exist
-    origin_regex = "|".join([f"^{p}$" for p in origin_regex_patterns]) if origin_regex_patterns else None
-    
+    # Wildcard origins (e.g. "https://*.vercel.app") are compiled by the middleware itself.
     app.add_middleware(
-        CORSMiddleware,
-        allow_origins=exact_origins if exact_origins else [],
-        allow_origin_regex=origin_regex,  # This handles wildcard patterns!
+        CachedCORSMiddleware,
+        allow_origins=settings.cors_origins,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        # Let browsers reuse a preflight for an hour instead of Starlette's 10 minutes
+        max_age=3600,
     )
 
     @app.get("/healthz", tags=["health"])
-    async def healthcheck() -> dict:
-        """Health check endpoint with system status."""
-        from backend.app.core.config import get_settings
-        from backend.app.db.session import get_engine
-        from pathlib import Path
-        
+    async def healthcheck() -> Response:
+        """Liveness probe: constant pre-rendered body, no DB or filesystem work."""
+        return _HEALTH_RESPONSE
+
+    @app.get("/healthz/deep", tags=["health"])
+    def healthcheck_deep() -> dict:
+        """Health check endpoint with system status (sync, so Starlette threadpools the DB call)."""
         status = {"status": "ok"}
         
         # Check database
-        try:
-            engine = get_engine()
-            with engine.connect() as conn:
-                conn.execute("SELECT 1")
-            status["database"] = "ok"
-        except Exception as e:
-            status["database"] = f"error: {str(e)}"
+        status["database"] = check_database()
+        if status["database"] != "ok":
             status["status"] = "degraded"
         
-        # Check file directories
+        # Directories are created in lifespan; a single stat confirms they survived
         settings = get_settings()
-        try:
-            uploads_dir = Path(settings.ingest_bucket_path)
-            uploads_dir.mkdir(parents=True, exist_ok=True)
-            status["uploads_dir"] = "ok" if uploads_dir.exists() and uploads_dir.is_dir() else "missing"
-        except Exception as e:
-            status["uploads_dir"] = f"error: {str(e)}"
-        
-        try:
-            processed_dir = Path(settings.processed_text_path)
-            processed_dir.mkdir(parents=True, exist_ok=True)
-            status["processed_dir"] = "ok" if processed_dir.exists() and processed_dir.is_dir() else "missing"
-        except Exception as e:
-            status["processed_dir"] = f"error: {str(e)}"
+        for key, directory in (
+            ("uploads_dir", settings.ingest_bucket_path),
+            ("processed_dir", settings.processed_text_path),
+        ):
+            status[key] = "ok" if os.path.isdir(directory) else "missing"
         
         return status
     
-    @app.get("/debug/paths", tags=["debug"])
-    async def debug_paths() -> dict:
-        """Debug endpoint to check filesystem paths."""
-        import os
-        current_dir = Path.cwd()
-        main_file = Path(__file__)
-        possible_frontend_paths = [
-            main_file.parent.parent.parent / "frontend",
-            Path("/app/frontend"),
-            Path("frontend"),
-        ]
+    # Filesystem inspection walks directories on every hit; keep it off unless asked for
+    if settings.debug:
+        @app.get("/debug/paths", tags=["debug"])
+        def debug_paths() -> dict:
+            """Debug endpoint to check filesystem paths."""
+            current_dir = Path.cwd()
+            main_file = Path(__file__)
         
-        results = {
-            "current_dir": str(current_dir),
-            "__file__": str(main_file),
-            "paths_checked": [],
-            "root_contents": [],
-            "root_tree": {}
-        }
+            results = {
+                "current_dir": str(current_dir),
+                "__file__": str(main_file),
+                "root_contents": [],
+                "root_tree": {}
+            }
         
-        # Check root directory contents with full tree
-        try:
-            root_path = Path("/app") if Path("/app").exists() else current_dir
-            if root_path.exists():
-                results["root_contents"] = [item.name for item in root_path.iterdir()]
-                # Build a tree structure
-                def build_tree(path: Path, max_depth: int = 3, current_depth: int = 0):
-                    if current_depth >= max_depth:
-                        return None
-                    if not path.exists():
-                        return None
-                    if path.is_file():
-                        return path.name
-                    if path.is_dir():
-                        try:
-                            children = {}
-                            for child in path.iterdir():
-                                child_tree = build_tree(child, max_depth, current_depth + 1)
-                                if child_tree is not None:
-                                    children[child.name] = child_tree
-                            return children if children else "empty"
-                        except PermissionError:
-                            return "permission_denied"
-                    return None
-                
-                results["root_tree"] = build_tree(root_path, max_depth=2)
-        except Exception as e:
-            results["root_contents_error"] = str(e)
+            # Check root directory contents with full tree
+            try:
+                root_path = Path("/app") if Path("/app").exists() else current_dir
+                if root_path.exists():
+                    results["root_contents"] = os.listdir(root_path)
+                    results["root_tree"] = scan_tree(root_path, max_depth=2)
+            except Exception as e:
+                results["root_contents_error"] = str(e)
         
-        # Check each possible frontend path
-        for path in possible_frontend_paths:
-            abs_path = path.resolve() if path.is_absolute() else current_dir / path
-            exists = abs_path.exists()
-            has_index = (abs_path / "index.html").exists() if exists else False
-            contents = []
-            if exists and abs_path.is_dir():
-                try:
-                    contents = [item.name for item in abs_path.iterdir()]
-                except Exception as e:
-                    contents = [f"error: {str(e)}"]
-            
-            results["paths_checked"].append({
-                "path": str(path),
-                "resolved": str(abs_path),
-                "exists": exists,
-                "has_index.html": has_index,
-                "contents": contents
-            })
+            # Frontend candidates were probed once at startup; the layout doesn't change after that
+            results["paths_checked"] = list(discover_frontend()[1])
         
-        return results
+            return results
     
-    @app.get("/debug/filesystem", tags=["debug"])
-    async def debug_filesystem() -> dict:
-        """Comprehensive filesystem inspection for debugging."""
-        import subprocess
-        current_dir = Path.cwd()
+        @app.get("/debug/filesystem", tags=["debug"])
+        def debug_filesystem() -> dict:
+            """Comprehensive filesystem inspection for debugging.
+
+            Plain ``def`` so Starlette runs the directory walk in its threadpool.
+            """
+            current_dir = Path.cwd()
         
-        results = {
-            "current_directory": str(current_dir),
-            "ls_root": [],
-            "ls_app": [],
-            "find_frontend": [],
-            "docker_check": {}
-        }
+            results = {
+                "current_directory": str(current_dir),
+                "ls_root": [],
+                "ls_app": [],
+                "find_frontend": [],
+                "docker_check": {}
+            }
         
-        # Try to list root directory
-        try:
-            root = Path("/app")
-            if root.exists():
-                results["ls_app"] = [item.name for item in root.iterdir()]
-        except Exception as e:
-            results["ls_app_error"] = str(e)
+            # Try to list root directory
+            try:
+                root = Path("/app")
+                if root.exists():
+                    results["ls_app"] = os.listdir(root)
+            except Exception as e:
+                results["ls_app_error"] = str(e)
         
-        # Try to find frontend using find command (if available)
-        try:
-            result = subprocess.run(
-                ["find", "/app", "-name", "index.html", "-type", "f", "2>/dev/null"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0:
-                results["find_frontend"] = result.stdout.strip().split("\n") if result.stdout.strip() else []
-        except Exception as e:
-            results["find_error"] = str(e)
+            # Find every index.html under /app without spawning a `find` process
+            try:
+                root = Path("/app")
+                if root.exists():
+                    results["find_frontend"] = sorted(str(path) for path in root.rglob("index.html") if path.is_file())
+            except Exception as e:
+                results["find_error"] = str(e)
         
-        # Check if we're in Docker
-        results["docker_check"] = {
-            "is_docker": Path("/.dockerenv").exists(),
-            "app_exists": Path("/app").exists(),
-            "frontend_exists": Path("/app/frontend").exists(),
-            "frontend_index_exists": Path("/app/frontend/index.html").exists() if Path("/app/frontend").exists() else False
-        }
+            # Check if we're in Docker
+            results["docker_check"] = {
+                "is_docker": Path("/.dockerenv").exists(),
+                "app_exists": Path("/app").exists(),
+                "frontend_exists": Path("/app/frontend").exists(),
+                "frontend_index_exists": Path("/app/frontend/index.html").exists() if Path("/app/frontend").exists() else False
+            }
         
-        return results
+            return results
 
     app.include_router(documents_router)
     app.include_router(evidence_router)
 
     # Serve frontend static files
-    # Try multiple paths to find frontend (works in both local and Docker)
     current_dir = Path.cwd()
     main_file_path = Path(__file__)
-    
-    possible_paths = [
-        main_file_path.parent.parent.parent / "frontend",  # Local: backend/app/main.py -> backend -> project root -> frontend
-        Path("/app/frontend"),  # Docker container (WORKDIR is /app)
-        current_dir / "frontend",  # Relative to current working directory
-    ]
-    
-    frontend_path = None
-    checked_paths_info = []
-    
-    for path in possible_paths:
-        # For absolute paths, use as-is; for relative, resolve from current_dir
-        if path.is_absolute():
-            abs_path = path
-        else:
-            abs_path = current_dir / path
-        
-        exists = abs_path.exists()
-        has_index = (abs_path / "index.html").exists() if exists else False
-        
-        checked_paths_info.append({
-            "original": str(path),
-            "resolved": str(abs_path),
-            "exists": exists,
-            "has_index": has_index
-        })
-        
-        logger.info(f"Checking frontend path: {abs_path} (exists: {exists}, has_index: {has_index})")
-        
-        if exists and has_index:
-            frontend_path = abs_path
-            logger.info(f"✓ Found frontend at: {frontend_path}")
-            break
+    frontend_path, checked_paths_info = discover_frontend()
     
     if frontend_path:
-        # Serve CSS and JS files
-        app.mount("/static", StaticFiles(directory=str(frontend_path)), name="static")
-
-        @app.get("/")
-        async def serve_frontend():
-            """Serve the frontend index page."""
-            index_path = frontend_path / "index.html"
-            if index_path.exists():
-                return FileResponse(str(index_path))
-            logger.error(f"Frontend index.html not found at {index_path}")
-            return {
-                "error": "Frontend file not found",
-                "expected_path": str(index_path),
-                "frontend_dir": str(frontend_path),
-                "checked_paths": checked_paths_info
-            }
-
-        # Serve CSS and JS directly
-        @app.get("/styles.css")
-        async def serve_css():
-            css_path = frontend_path / "styles.css"
-            if css_path.exists():
-                return FileResponse(str(css_path), media_type="text/css")
-            return {"error": f"CSS not found at {css_path}"}
-
-        @app.get("/app.js")
-        async def serve_js():
-            js_path = frontend_path / "app.js"
-            if js_path.exists():
-                return FileResponse(str(js_path), media_type="application/javascript")
-            return {"error": f"JS not found at {js_path}"}
+        # Kept for older links to /static/*
+        app.mount(
+            "/static",
+            CachedStaticFiles(directory=str(frontend_path), max_age=settings.static_max_age),
+            name="static",
+        )
+        # Catch-all mount goes last so API routes win; serves index.html for "/"
+        # plus /styles.css and /app.js without per-request path checks.
+        # Outside development the bundle is fixed for the process lifetime, so serve it from memory
+        preload = FRONTEND_ASSETS if settings.app_env != "development" else ()
+        app.mount(
+            "/",
+            CachedStaticFiles(
+                directory=str(frontend_path),
+                html=True,
+                max_age=settings.static_max_age,
+                preload=preload,
+            ),
+            name="frontend",
+        )
     else:
         # Fallback: return API info if frontend not found
         logger.error(f"Frontend not found! Checked paths: {checked_paths_info}")
         logger.error(f"Current working directory: {current_dir}")
         logger.error(f"Main file location: {main_file_path}")
         
+        # Everything below is fixed at startup, so encode it once
+        fallback_response = ORJSONResponse({
+            "message": "Fact-Check API is running",
+            "docs": "/docs",
+            "health": "/healthz",
+            "debug": "/debug/paths" if settings.debug else None,
+            "error": "Frontend files not found",
+            "checked_paths": checked_paths_info,
+            "current_dir": str(current_dir),
+            "__file__": str(main_file_path),
+            "frontend_expected_at": "/app/frontend (Docker) or ./frontend (local)"
+        })
+
         @app.get("/")
-        async def root():
-            return {
-                "message": "Fact-Check API is running",
-                "docs": "/docs",
-                "health": "/healthz",
-                "debug": "/debug/paths",
-                "error": "Frontend files not found",
-                "checked_paths": checked_paths_info,
-                "current_dir": str(current_dir),
-                "__file__": str(main_file_path),
-                "frontend_expected_at": "/app/frontend (Docker) or ./frontend (local)"
-            }
+        async def root() -> Response:
+            return fallback_response
 
     return app
 
@@ -23,4 +23,5 @@ class ClaimRead(BaseModel):
 
 class ClaimList(BaseModel):
     items: list[ClaimRead]
+    next_offset: Optional[int] = None
 
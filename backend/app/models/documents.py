@@ -27,4 +27,5 @@ class DocumentRead(DocumentBase):
 
 class DocumentList(BaseModel):
     items: list[DocumentRead]
+    next_offset: Optional[int] = None
 
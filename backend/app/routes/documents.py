@@ -1,5 +1,10 @@
 """Document ingestion API routes."""
 
+import asyncio
+import logging
+from collections import Counter
+from functools import lru_cache
+
 from fastapi import (
     APIRouter,
     BackgroundTasks,
@@ -7,26 +12,129 @@ from fastapi import (
     File,
     Form,
     HTTPException,
+    Query,
     UploadFile,
     status,
 )
+from sqlalchemy import bindparam, case, func
 from sqlmodel import Session, select
-
-import logging
+from starlette.concurrency import run_in_threadpool
 
 from backend.app.db.models import Document
-from backend.app.db.session import get_session
+from backend.app.db.session import get_engine, get_session
 from backend.app.models.claims import ClaimList, ClaimRead
 from backend.app.models.documents import DocumentList, DocumentRead
 from backend.app.models.results import DocumentResults, VerdictSummary
 from backend.app.core.config import get_settings
-from backend.app.services.ingestion import IngestionService, create_default_ingestion_service
+from backend.app.services.ingestion import (
+    IngestionService,
+    UploadTooLargeError,
+    create_default_ingestion_service,
+)
 from backend.app.worker.queue import JobQueue, resolve_job_queue
 from backend.app.services.claims import ClaimService
 from backend.app.services.verification import ClaimVerifier, create_verifier
 from backend.app.db.models import Claim
 
 router = APIRouter(prefix="/v1/documents", tags=["documents"])
+logger = logging.getLogger(__name__)
+
+# Verdicts for non-factual content; their scores are left out of the document average
+_NON_FACTUAL_VERDICTS = frozenset({"not_applicable", "antisemitic_trope"})
+_SUMMARY_VERDICTS = tuple(VerdictSummary.model_fields)
+ENQUEUE_TIMEOUT = 2.0
+# Claims verified at once; verifiers are network-bound, the cap keeps provider rate limits in check
+VERIFY_CONCURRENCY = 8
+_CLAIM_FIELDS = tuple(ClaimRead.model_fields)
+_DOCUMENT_FIELDS = tuple(DocumentRead.model_fields)
+
+# Per-request queries are built once and bound per call, so requests skip statement
+# construction and cache-key generation and go straight to the compiled-SQL cache.
+_DOCUMENT_EXISTS = select(Document.id).where(Document.id == bindparam("document_id"))
+_CLAIM_IDS = (
+    select(Claim.id)
+    .where(Claim.document_id == bindparam("document_id"))
+    .order_by(Claim.created_at)
+)
+_CLAIM_TEXTS = (
+    select(Claim.text)
+    .where(Claim.document_id == bindparam("document_id"))
+)
+_CLAIMS_PAGE = (
+    select(Claim)
+    .where(Claim.document_id == bindparam("document_id"))
+    .order_by(Claim.created_at, Claim.id)
+    .limit(bindparam("limit"))
+    .offset(bindparam("offset"))
+)
+_DOCUMENTS_PAGE = (
+    select(Document)
+    .order_by(Document.created_at.desc(), Document.id.desc())
+    .limit(bindparam("limit"))
+    .offset(bindparam("offset"))
+)
+# One aggregate row per verdict instead of hydrating every claim. Scores only count
+# for factual verdicts; the CASE yields NULL otherwise, which SUM/COUNT skip.
+_FACTUAL_SCORE = case((Claim.verdict.not_in(_NON_FACTUAL_VERDICTS), Claim.score))
+_VERDICT_TOTALS = (
+    select(
+        Claim.verdict,
+        func.count(),
+        func.sum(_FACTUAL_SCORE),
+        func.count(_FACTUAL_SCORE),
+    )
+    .where(Claim.document_id == bindparam("document_id"))
+    .group_by(Claim.verdict)
+)
+
+
+def _document_exists(session: Session, document_id: str) -> bool:
+    """Primary-key probe that reads only the id, not the whole document row."""
+    row = session.exec(_DOCUMENT_EXISTS, params={"document_id": document_id}).first()
+    return row is not None
+
+
+# Rows coming out of the DB are already typed, so skip re-validating them
+def _claim_read(claim: Claim) -> ClaimRead:
+    return ClaimRead.model_construct(**{k: getattr(claim, k) for k in _CLAIM_FIELDS})
+
+
+def _document_read(document: Document) -> DocumentRead:
+    return DocumentRead.model_construct(**{k: getattr(document, k) for k in _DOCUMENT_FIELDS})
+
+
+def _page(rows: list, limit: int, offset: int) -> tuple[list, int | None]:
+    """Trim a ``limit + 1`` fetch to one page and compute the next offset."""
+    if len(rows) > limit:
+        return rows[:limit], offset + limit
+    return rows, None
+
+
+def _claim_ids(session: Session, document_id: str) -> list[str]:
+    return list(session.exec(_CLAIM_IDS, params={"document_id": document_id}).all())
+
+
+def _prepare_verifier(verifier: ClaimVerifier, session: Session, document_id: str) -> None:
+    """Let verifiers that support it batch per-document work before claims fan out."""
+    prepare = getattr(verifier, "prepare", None)
+    if prepare is not None:
+        prepare(list(session.exec(_CLAIM_TEXTS, params={"document_id": document_id}).all()))
+
+
+def _verify_claim(verifier: ClaimVerifier, claim_id: str) -> ClaimRead | None:
+    """Verify one claim in its own session; sessions are not shared across threads."""
+    with Session(get_engine()) as session:
+        claim = session.get(Claim, claim_id)
+        if claim is None:
+            return None
+        return _claim_read(verifier.verify(claim, session))
+
+
+def _persist(session: Session, document: Document) -> Document:
+    session.add(document)
+    session.commit()
+    session.refresh(document)
+    return document
 
 
 def get_ingestion_service() -> IngestionService:
@@ -38,7 +146,9 @@ def get_job_queue() -> JobQueue:
     return resolve_job_queue()
 
 
+@lru_cache(maxsize=1)
 def get_claim_service() -> ClaimService:
+    """Share one claim service; it holds only the process-wide extractor."""
     return ClaimService()
 
 
@@ -49,6 +159,7 @@ def get_claim_service() -> ClaimService:
     summary="Upload a document for fact-checking",
 )
 async def upload_document(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(..., description="PDF, DOCX, image (PNG/JPG/GIF/WEBP), or text file."),
     title: str | None = Form(default=None),
     source_type: str = Form(default="upload"),
@@ -57,36 +168,33 @@ async def upload_document(
     job_queue: JobQueue = Depends(get_job_queue),
 ) -> DocumentRead:
     """Accept a document upload, store the artifact, and create a DB record."""
-    import logging
-    import asyncio
-    logger = logging.getLogger(__name__)
-    
     # File size limit: 100MB
     MAX_FILE_SIZE = 100 * 1024 * 1024
     
     try:
         logger.info(f"Received upload request: filename={file.filename}, title={title}")
         
-        # Read file with size check
-        file_bytes = await file.read()
-        file_size = len(file_bytes)
-        logger.info(f"File read successfully, size: {file_size} bytes")
-        
-        if file_size > MAX_FILE_SIZE:
+        # Stream file to disk with size check
+        try:
+            stored_path, file_size = await run_in_threadpool(
+                ingestion_service.store_raw_stream,
+                file.file,
+                file.filename,
+                max_bytes=MAX_FILE_SIZE,
+            )
+        except UploadTooLargeError:
             raise HTTPException(
                 status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
                 detail=f"File too large. Maximum size is {MAX_FILE_SIZE / (1024*1024):.0f}MB"
             )
-        
+        logger.info(f"File stored at: {stored_path}, size: {file_size} bytes")
+
         if file_size == 0:
+            stored_path.unlink(missing_ok=True)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="File is empty"
             )
-        
-        # Store file
-        stored_path = ingestion_service.store_raw(file_bytes, file.filename)
-        logger.info(f"File stored at: {stored_path}")
 
         # Create document record
         document = Document(
@@ -95,21 +203,24 @@ async def upload_document(
             raw_path=str(stored_path),
             ingest_status="processing",
         )
-        session.add(document)
-        session.commit()
-        session.refresh(document)
+        document = await run_in_threadpool(_persist, session, document)
         logger.info(f"Document created with ID: {document.id}")
 
-        # Enqueue job (non-blocking, fire and forget)
+        # Enqueue job; both queue backends hand off quickly, so wait briefly and
+        # fall back to a post-response retry rather than an untracked task. The retry
+        # is safe if the timed-out attempt did reach the queue: both backends key jobs
+        # by document id and ignore a repeat enqueue.
         try:
-            # Don't await - let it run in background to avoid timeout
-            asyncio.create_task(job_queue.enqueue(document.id))
+            await asyncio.wait_for(job_queue.enqueue(document.id), timeout=ENQUEUE_TIMEOUT)
             logger.info(f"Job enqueued for document {document.id}")
+        except asyncio.TimeoutError:
+            logger.warning(f"Enqueue timed out for document {document.id}; retrying after response")
+            background_tasks.add_task(job_queue.enqueue, document.id)
         except Exception as job_error:
             logger.error(f"Failed to enqueue job for document {document.id}: {str(job_error)}")
             # Don't fail the upload if job enqueue fails - job can be retried later
-        
-        return DocumentRead.model_validate(document)
+
+        return _document_read(document)
         
     except HTTPException:
         # Re-raise HTTP exceptions as-is
@@ -133,13 +244,20 @@ async def upload_document(
 )
 def list_claims(
     document_id: str,
+    limit: int = Query(default=100, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0),
     session: Session = Depends(get_session),
 ) -> ClaimList:
-    document = session.get(Document, document_id)
-    if document is None:
+    if not _document_exists(session, document_id):
         raise HTTPException(status_code=404, detail="Document not found")
-    claims = session.exec(select(Claim).where(Claim.document_id == document_id)).all()
-    return ClaimList(items=[ClaimRead.model_validate(c) for c in claims])
+    rows = session.exec(
+        _CLAIMS_PAGE,
+        params={"document_id": document_id, "limit": limit + 1, "offset": offset},
+    ).all()
+    claims, next_offset = _page(rows, limit, offset)
+    return ClaimList.model_construct(
+        items=[_claim_read(c) for c in claims], next_offset=next_offset
+    )
 
 
 @router.post(
@@ -156,7 +274,7 @@ def reextract_claims(
     if document is None:
         raise HTTPException(status_code=404, detail="Document not found")
     claims = claim_service.extract_for_document(session, document)
-    return ClaimList(items=[ClaimRead.model_validate(c) for c in claims])
+    return ClaimList.model_construct(items=[_claim_read(c) for c in claims])
 
 
 @router.get(
@@ -165,13 +283,15 @@ def reextract_claims(
     summary="List ingested documents",
 )
 def list_documents(
-    limit: int = 50,
+    limit: int = Query(default=50, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0),
     session: Session = Depends(get_session),
 ) -> DocumentList:
-    results = session.exec(
-        select(Document).order_by(Document.created_at.desc()).limit(limit)
-    ).all()
-    return DocumentList(items=[DocumentRead.model_validate(doc) for doc in results])
+    rows = session.exec(_DOCUMENTS_PAGE, params={"limit": limit + 1, "offset": offset}).all()
+    results, next_offset = _page(rows, limit, offset)
+    return DocumentList.model_construct(
+        items=[_document_read(doc) for doc in results], next_offset=next_offset
+    )
 
 
 @router.get(
@@ -183,7 +303,6 @@ def get_document(
     document_id: str,
     session: Session = Depends(get_session),
 ) -> DocumentRead:
-    logger = logging.getLogger(__name__)
     document = session.get(Document, document_id)
     if document is None:
         logger.warning("Document %s not found", document_id)
@@ -195,7 +314,7 @@ def get_document(
         document.ingest_progress,
         document.ingest_progress_message,
     )
-    return DocumentRead.model_validate(document)
+    return _document_read(document)
 
 
 @router.post(
@@ -203,30 +322,29 @@ def get_document(
     response_model=ClaimList,
     summary="Verify all claims for a document",
 )
-def verify_claims(
+async def verify_claims(
     document_id: str,
     session: Session = Depends(get_session),
 ) -> ClaimList:
     """Verify all claims for a document using LLM."""
-    document = session.get(Document, document_id)
-    if document is None:
+    if not await run_in_threadpool(_document_exists, session, document_id):
         raise HTTPException(status_code=404, detail="Document not found")
 
-    claims = session.exec(select(Claim).where(Claim.document_id == document_id)).all()
-    if not claims:
+    claim_ids = await run_in_threadpool(_claim_ids, session, document_id)
+    if not claim_ids:
         raise HTTPException(status_code=404, detail="No claims found for document")
 
-    verifier = create_verifier()
-    verified = []
-    for claim in claims:
-        try:
-            verified_claim = verifier.verify(claim, session)
-            verified.append(verified_claim)
-        except Exception as e:
-            # Continue with other claims even if one fails
-            pass
+    verifier = await run_in_threadpool(create_verifier)
+    await run_in_threadpool(_prepare_verifier, verifier, session, document_id)
+    semaphore = asyncio.Semaphore(VERIFY_CONCURRENCY)
 
-    return ClaimList(items=[ClaimRead.model_validate(c) for c in verified])
+    async def verify(claim_id: str) -> ClaimRead | None:
+        async with semaphore:
+            return await asyncio.to_thread(_verify_claim, verifier, claim_id)
+
+    # Failed claims come back as exceptions and are skipped, as before
+    results = await asyncio.gather(*(verify(cid) for cid in claim_ids), return_exceptions=True)
+    return ClaimList.model_construct(items=[r for r in results if isinstance(r, ClaimRead)])
 
 
 @router.get(
@@ -239,14 +357,23 @@ def get_document_results(
     session: Session = Depends(get_session),
 ) -> DocumentResults:
     """Get aggregated results including overall score and verdict breakdown."""
-    logger = logging.getLogger(__name__)
-    document = session.get(Document, document_id)
-    if document is None:
+    if not _document_exists(session, document_id):
         logger.warning("Results requested for missing document %s", document_id)
         raise HTTPException(status_code=404, detail="Document not found")
 
-    claims = session.exec(select(Claim).where(Claim.document_id == document_id)).all()
-    total_claims = len(claims)
+    rows = session.exec(_VERDICT_TOTALS, params={"document_id": document_id}).all()
+    # Count verdicts in one pass with running score totals; missing/empty verdicts
+    # mean the claim has not been verified yet
+    verdict_counts: Counter[str] = Counter()
+    total_claims = 0
+    score_total = 0.0
+    scored = 0
+    for verdict, count, score_sum, score_count in rows:
+        total_claims += count
+        verdict_counts[verdict or "unverified"] += count
+        if verdict and score_count:
+            score_total += score_sum
+            scored += score_count
 
     if total_claims == 0:
         return DocumentResults(
@@ -258,29 +385,7 @@ def get_document_results(
             risk_level="unknown",
         )
 
-    # Count verdicts
-    verdict_counts = {
-        "supported": 0,
-        "partial": 0,
-        "contradicted": 0,
-        "no_evidence": 0,
-        "not_applicable": 0,
-        "antisemitic_trope": 0,
-        "unverified": 0,
-    }
-
-    scores = []
-    for claim in claims:
-        if claim.verdict:
-            verdict_counts[claim.verdict] = verdict_counts.get(claim.verdict, 0) + 1
-            # Only include scores from factual claims (exclude not_applicable and antisemitic_trope)
-            if claim.score is not None and claim.verdict not in ["not_applicable", "antisemitic_trope"]:
-                scores.append(claim.score)
-        else:
-            verdict_counts["unverified"] += 1
-
-    # Calculate overall score (average of factual claim scores only, excluding not_applicable)
-    overall_score = sum(scores) / len(scores) if scores else None
+    overall_score = score_total / scored if scored else None
 
     # Determine risk level
     if overall_score is None:
@@ -299,13 +404,7 @@ def get_document_results(
         verified_claims=verified_claims,
         overall_score=round(overall_score, 2) if overall_score is not None else None,
         verdict_summary=VerdictSummary(
-            supported=verdict_counts["supported"],
-            partial=verdict_counts["partial"],
-            contradicted=verdict_counts["contradicted"],
-            no_evidence=verdict_counts["no_evidence"],
-            not_applicable=verdict_counts["not_applicable"],
-            antisemitic_trope=verdict_counts["antisemitic_trope"],
-            unverified=verdict_counts["unverified"],
+            **{name: verdict_counts[name] for name in _SUMMARY_VERDICTS}
         ),
         risk_level=risk_level,
     )
@@ -1,8 +1,12 @@
 """Evidence/RAG API routes."""
 
+import shutil
+import tempfile
+import threading
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile, status
+from starlette.concurrency import run_in_threadpool
 
 from backend.app.core.config import get_settings
 from backend.app.services.rag import EvidenceRetriever, create_default_evidence_retriever
@@ -10,9 +14,30 @@ from backend.app.services.rag import EvidenceRetriever, create_default_evidence_
 router = APIRouter(prefix="/v1/evidence", tags=["evidence"])
 
 
-def get_evidence_retriever() -> EvidenceRetriever:
-    """Dependency for evidence retriever."""
-    return create_default_evidence_retriever()
+_retriever_lock = threading.Lock()
+
+
+def get_evidence_retriever(request: Request) -> EvidenceRetriever:
+    """Dependency for the app's shared evidence retriever.
+
+    Built on first use rather than at startup so the embedding model only loads
+    when evidence is actually requested; later requests reuse it from app state.
+    """
+    state = request.app.state
+    retriever = getattr(state, "evidence_retriever", None)
+    if retriever is None:
+        with _retriever_lock:
+            retriever = getattr(state, "evidence_retriever", None)
+            if retriever is None:
+                retriever = state.evidence_retriever = create_default_evidence_retriever()
+    return retriever
+
+
+def _spool_to_temp(file: UploadFile) -> Path:
+    suffix = Path(file.filename or "").suffix
+    with tempfile.NamedTemporaryFile("wb", suffix=suffix, delete=False) as dst:
+        shutil.copyfileobj(file.file, dst, length=1 << 20)
+    return Path(dst.name)
 
 
 @router.post(
@@ -30,13 +55,11 @@ async def load_evidence(
     Uses free local embeddings (sentence-transformers) if OPENAI_API_KEY is not set.
     """
 
-    # Save uploaded file temporarily
-    file_bytes = await file.read()
-    temp_path = Path(f"/tmp/{file.filename}")
-    temp_path.write_bytes(file_bytes)
+    # Save uploaded file temporarily, streamed in chunks to a unique path
+    temp_path = await run_in_threadpool(_spool_to_temp, file)
 
     try:
-        evidence_retriever.load_from_file(temp_path, source_name)
+        await run_in_threadpool(evidence_retriever.load_from_file, temp_path, source_name)
         return {
             "status": "loaded",
             "source_name": source_name,
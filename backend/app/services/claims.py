@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import heapq
 import json
+import logging
+import mmap
+import os
 import re
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Protocol
+from typing import Iterable, Protocol
 
 from sqlmodel import Session, delete, select
 
@@ -14,6 +20,76 @@ from backend.app.core.config import get_settings
 from backend.app.db.models import Claim, Document
 from backend.app.services.semantic_analysis import create_semantic_analyzer
 
+logger = logging.getLogger(__name__)
+
+# Conspiracy theory indicators
+CONSPIRACY_PATTERNS = (
+    "secret", "conspiracy", "plot", "control", "network", "shadow",
+    "behind the scenes", "they", "them", "international", "global",
+    "spying", "surveillance", "intrigue", "manipulate", "influence",
+)
+
+# Antisemitic trope keywords
+ANTISEMITIC_KEYWORDS = (
+    "zionist", "jewish", "jew", "israel", "holocaust", "protocols",
+    "elders of zion", "world domination", "control banks", "control media",
+)
+
+# Threatening language
+THREAT_KEYWORDS = ("war", "threaten", "example", "show", "get you", "gone get")
+
+# Responsibility/blame claims (common in antisemitic rhetoric), matched on lemmas
+RESPONSIBILITY_LEMMAS = frozenset({"bear", "responsible", "blame", "cause", "control", "influence"})
+
+# Entity labels that mark a sentence as a factual claim (dates, numbers, named entities)
+FACTUAL_ENTITY_LABELS = frozenset({"PERSON", "ORG", "GPE", "DATE", "CARDINAL", "EVENT"})
+
+
+def _keyword_regex(keywords: Iterable[str]) -> re.Pattern[str]:
+    """Compile a substring matcher reporting every offset where a keyword starts.
+
+    The zero-width lookahead lets matches overlap, and shortest-first alternation makes
+    each hit end as early as possible, so "does this span contain a keyword" can be
+    answered from the (start, end) hits alone.
+    """
+    alternation = "|".join(re.escape(k) for k in sorted(keywords, key=len))
+    return re.compile(f"(?=({alternation}))", re.IGNORECASE)
+
+
+_CONSPIRACY_RE = _keyword_regex(CONSPIRACY_PATTERNS)
+_ANTISEMITIC_RE = _keyword_regex(ANTISEMITIC_KEYWORDS)
+_THREAT_RE = _keyword_regex(THREAT_KEYWORDS)
+# Substring stand-in for the lemma check where no spaCy doc is available
+_RESPONSIBILITY_RE = _keyword_regex(RESPONSIBILITY_LEMMAS)
+
+
+class _KeywordHits:
+    """Sorted keyword hit offsets for one document, queried per sentence span."""
+
+    __slots__ = ("starts", "ends")
+
+    def __init__(self, pattern: re.Pattern[str], text: str):
+        self.starts: list[int] = []
+        self.ends: list[int] = []
+        for match in pattern.finditer(text):
+            self.starts.append(match.start())
+            self.ends.append(match.end(1))
+
+    def within(self, start: int, end: int) -> bool:
+        i = bisect_left(self.starts, start)
+        while i < len(self.starts) and self.starts[i] < end:
+            if self.ends[i] <= end:
+                return True
+            i += 1
+        return False
+
+
+def _has_any_keyword(text: str) -> bool:
+    return any(
+        rx.search(text)
+        for rx in (_ANTISEMITIC_RE, _THREAT_RE, _RESPONSIBILITY_RE, _CONSPIRACY_RE)
+    )
+
 
 @dataclass
 class ClaimCandidate:
@@ -34,13 +110,29 @@ class ClaimExtractor(Protocol):
 class SpacyClaimExtractor:
     """spaCy-based extractor that identifies factual claims using NLP."""
 
+    # Keep only this many highest-importance sentences per document (None keeps all)
+    max_claims: int | None = None
+    # Semantic analysis is skipped for texts this long, and capped at this many sentences otherwise
+    semantic_max_chars: int = 50000
+    semantic_max_sentences: int = 200
+
     def __init__(self):
+        settings = get_settings()
+        self.max_claims = settings.max_claims_per_document
+        self.semantic_max_chars = settings.semantic_analysis_max_chars
+        self.semantic_max_sentences = settings.semantic_analysis_max_sentences
         try:
             import spacy
 
             # Load spaCy model (download with: python -m spacy download en_core_web_sm)
             try:
-                self.nlp = spacy.load("en_core_web_sm")
+                # The dependency parser is only used for sentence boundaries; the much cheaper
+                # senter gives those, while tagger/lemmatizer/NER still feed pos_/lemma_/ents
+                self.nlp = spacy.load("en_core_web_sm", exclude=["parser"])
+                if "senter" in self.nlp.component_names:
+                    self.nlp.enable_pipe("senter")
+                else:
+                    self.nlp.add_pipe("sentencizer", first=True)
             except OSError:
                 # Fallback to blank model if not installed
                 self.nlp = spacy.blank("en")
@@ -62,68 +154,109 @@ class SpacyClaimExtractor:
         
         # For short texts (like tweets), keep as single claim with full context
         if len(text.strip()) < 500:
-            # Run semantic analysis on full text
-            semantic_analysis = None
-            if self.semantic_analyzer:
-                try:
-                    semantic_analysis = self.semantic_analyzer.analyze(text.strip())
-                except Exception:
-                    pass
-            
-            metadata = {
-                "strategy": "spacy_fulltext_short",
-                "is_short_text": True,
-            }
-            
-            if semantic_analysis:
-                metadata["semantic_analysis"] = {
-                    "is_antisemitic": semantic_analysis.is_antisemitic,
-                    "confidence": semantic_analysis.confidence,
-                    "detected_patterns": semantic_analysis.detected_patterns,
-                    "coded_language_detected": semantic_analysis.coded_language_detected,
-                    "implicit_meaning": semantic_analysis.implicit_meaning,
-                }
-            
-            return [
-                ClaimCandidate(
-                    text=text.strip(),
-                    span_start=0,
-                    span_end=len(text),
-                    metadata=metadata,
-                )
-            ]
-        
+            return self._extract_short(text)
+
         # For longer texts, use sentence-based extraction
-        doc = self.nlp(text)
+        return self._extract_from_doc(text, self.nlp(text))
+
+    def extract_batch(self, texts: list[str], batch_size: int = 64) -> list[list[ClaimCandidate]]:
+        """Extract claims for many texts, running the long ones through ``nlp.pipe`` in this process."""
+        results: list[list[ClaimCandidate] | None] = [None] * len(texts)
+        long_indices = []
+        for i, text in enumerate(texts):
+            if len(text.strip()) < 500:
+                results[i] = self._extract_short(text)
+            else:
+                long_indices.append(i)
+
+        docs = self.nlp.pipe((texts[i] for i in long_indices), batch_size=batch_size)
+        for i, doc in zip(long_indices, docs):
+            results[i] = self._extract_from_doc(texts[i], doc)
+        return results
+
+    def _extract_short(self, text: str) -> list[ClaimCandidate]:
+        """Keep a short text as one claim with full context."""
+        # Run semantic analysis on full text, unless no keyword category matches at all
+        semantic_analysis = None
+        if self.semantic_analyzer and _has_any_keyword(text):
+            try:
+                semantic_analysis = self.semantic_analyzer.analyze(text.strip())
+            except Exception:
+                pass
+        
+        metadata = {
+            "strategy": "spacy_fulltext_short",
+            "is_short_text": True,
+        }
+        
+        if semantic_analysis:
+            metadata["semantic_analysis"] = {
+                "is_antisemitic": semantic_analysis.is_antisemitic,
+                "confidence": semantic_analysis.confidence,
+                "detected_patterns": semantic_analysis.detected_patterns,
+                "coded_language_detected": semantic_analysis.coded_language_detected,
+                "implicit_meaning": semantic_analysis.implicit_meaning,
+            }
         
+        return [
+            ClaimCandidate(
+                text=text.strip(),
+                span_start=0,
+                span_end=len(text),
+                metadata=metadata,
+            )
+        ]
+
+    def _apply_semantic_analysis(self, pending: list[tuple[ClaimCandidate, str]]) -> None:
+        """Run one batched analyzer call and fold the results into candidate metadata."""
+        try:
+            analyses = self.semantic_analyzer.analyze_batch(
+                [candidate.text for candidate, _ in pending],
+                [context for _, context in pending],
+            )
+        except Exception:
+            return  # Continue without semantic analysis if it fails
+
+        for (candidate, _), semantic_analysis in zip(pending, analyses):
+            metadata = candidate.metadata
+            if semantic_analysis.is_antisemitic and semantic_analysis.confidence > 0.5:
+                metadata["importance_score"] += 4  # Highest weight for semantically detected antisemitism
+            metadata["semantic_analysis"] = {
+                "is_antisemitic": semantic_analysis.is_antisemitic,
+                "confidence": semantic_analysis.confidence,
+                "detected_patterns": semantic_analysis.detected_patterns,
+                "coded_language_detected": semantic_analysis.coded_language_detected,
+                "implicit_meaning": semantic_analysis.implicit_meaning,
+            }
+
+    def _extract_from_doc(self, text: str, doc) -> list[ClaimCandidate]:
+        """Sentence-based extraction over an already-processed spaCy doc."""
         # Get paragraph context for semantic analysis
         paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
         
         # Build a simple map: for each sentence, find which paragraph it's in
+        para_starts = []
+        offset = 0
+        for para in paragraphs:
+            para_starts.append(offset)
+            offset += len(para) + 2  # +2 for \n\n separator
+
         def get_paragraph_for_position(pos: int) -> str:
             """Find the paragraph containing a given character position."""
-            current_pos = 0
-            for para in paragraphs:
-                para_start = current_pos
-                para_end = current_pos + len(para)
-                if para_start <= pos <= para_end:
-                    return para
-                current_pos = para_end + 2  # +2 for \n\n separator
+            i = bisect_right(para_starts, pos) - 1
+            if i >= 0 and pos <= para_starts[i] + len(paragraphs[i]):
+                return paragraphs[i]
             return paragraphs[0] if paragraphs else ""
 
-        # Conspiracy theory indicators
-        conspiracy_patterns = [
-            "secret", "conspiracy", "plot", "control", "network", "shadow",
-            "behind the scenes", "they", "them", "international", "global",
-            "spying", "surveillance", "intrigue", "manipulate", "influence"
-        ]
-        
-        # Antisemitic trope keywords
-        antisemitic_keywords = [
-            "zionist", "jewish", "jew", "israel", "holocaust", "protocols",
-            "elders of zion", "world domination", "control banks", "control media"
-        ]
+        # One case-insensitive scan per keyword category over the whole document;
+        # sentences then look up hits inside their span instead of rescanning
+        conspiracy_hits = _KeywordHits(_CONSPIRACY_RE, text)
+        antisemitic_hits = _KeywordHits(_ANTISEMITIC_RE, text)
+        threat_hits = _KeywordHits(_THREAT_RE, text)
 
+        analyze_sentences = self.semantic_analyzer is not None and len(text) < self.semantic_max_chars
+        pending: list[tuple[ClaimCandidate, str]] = []
+        over_budget = 0
         candidates: list[ClaimCandidate] = []
         for sent in doc.sents:
             sent_text = sent.text.strip()
@@ -135,54 +268,47 @@ class SpacyClaimExtractor:
             if sent_text.endswith("?"):
                 continue
 
-            sent_lower = sent_text.lower()
-            
             # Detect conspiracy theory language
-            has_conspiracy_language = any(pattern in sent_lower for pattern in conspiracy_patterns)
-            has_antisemitic_keywords = any(keyword in sent_lower for keyword in antisemitic_keywords)
+            has_conspiracy_language = conspiracy_hits.within(sent.start_char, sent.end_char)
+            has_antisemitic_keywords = antisemitic_hits.within(sent.start_char, sent.end_char)
             
             # Look for factual indicators (dates, numbers, named entities)
             entities = list(sent.ents)
-            has_entities = any(ent.label_ in ["PERSON", "ORG", "GPE", "DATE", "CARDINAL", "EVENT"] for ent in entities)
-            has_verbs = any(token.pos_ == "VERB" for token in sent)
-            
-            # Check for claims about responsibility/blame (common in antisemitic rhetoric)
-            has_responsibility_verbs = any(
-                token.lemma_.lower() in ["bear", "responsible", "blame", "cause", "control", "influence"]
-                for token in sent
-            )
+            has_entities = any(ent.label_ in FACTUAL_ENTITY_LABELS for ent in entities)
+
+            # Verbs and responsibility/blame lemmas (common in antisemitic rhetoric)
+            # in one pass over the tokens, stopping once both are found
+            has_verbs = False
+            has_responsibility_verbs = False
+            for token in sent:
+                if not has_verbs and token.pos_ == "VERB":
+                    has_verbs = True
+                if not has_responsibility_verbs and token.lemma_.lower() in RESPONSIBILITY_LEMMAS:
+                    has_responsibility_verbs = True
+                if has_verbs and has_responsibility_verbs:
+                    break
             
             # Check for threatening language
-            threat_keywords = ["war", "threaten", "example", "show", "get you", "gone get"]
-            has_threat_language = any(keyword in sent_lower for keyword in threat_keywords)
+            has_threat_language = threat_hits.within(sent.start_char, sent.end_char)
 
-            # Get paragraph context for semantic analysis
-            context = get_paragraph_for_position(sent.start_char)
-            
-            # Run semantic analysis for coded language detection
+            # Sentences flagged by the cheap keyword/lemma signals get semantic analysis
+            # for coded language; it is an LLM call, so it runs batched after this loop.
             # Skip for very long documents to speed up processing
-            semantic_analysis = None
-            if self.semantic_analyzer and len(text) < 50000:  # Skip semantic analysis for very long docs
-                try:
-                    # Use full paragraph context for better understanding
-                    semantic_analysis = self.semantic_analyzer.analyze(sent_text, context=context)
-                except Exception:
-                    pass  # Continue without semantic analysis if it fails
+            has_cheap_signal = (
+                has_conspiracy_language
+                or has_antisemitic_keywords
+                or has_responsibility_verbs
+                or has_threat_language
+            )
             
             # Prioritize sentences that:
             # 1. Have entities/verbs (factual claims)
             # 2. Contain conspiracy language (important to fact-check)
             # 3. Contain antisemitic keywords (critical to verify)
             # 4. Make responsibility/blame claims
-            # 5. Semantic analysis detects antisemitic content (even without keywords)
+            # 5. Semantic analysis detects antisemitic content (applied after the loop)
             # 6. Contain threatening language directed at groups
-            has_semantic_antisemitism = (
-                semantic_analysis and 
-                semantic_analysis.is_antisemitic and 
-                semantic_analysis.confidence > 0.5
-            )
-            
-            if has_entities or has_verbs or has_conspiracy_language or has_antisemitic_keywords or has_responsibility_verbs or has_semantic_antisemitism or has_threat_language:
+            if has_entities or has_verbs or has_cheap_signal:
                 # Calculate claim importance score
                 importance = 0
                 if has_entities:
@@ -195,8 +321,6 @@ class SpacyClaimExtractor:
                     importance += 3  # Highest weight for antisemitic content
                 if has_responsibility_verbs:
                     importance += 1
-                if has_semantic_antisemitism:
-                    importance += 4  # Highest weight for semantically detected antisemitism
                 if has_threat_language:
                     importance += 3  # High weight for threatening language
                 
@@ -210,29 +334,39 @@ class SpacyClaimExtractor:
                     "importance_score": importance,
                 }
                 
-                # Add semantic analysis results
-                if semantic_analysis:
-                    metadata["semantic_analysis"] = {
-                        "is_antisemitic": semantic_analysis.is_antisemitic,
-                        "confidence": semantic_analysis.confidence,
-                        "detected_patterns": semantic_analysis.detected_patterns,
-                        "coded_language_detected": semantic_analysis.coded_language_detected,
-                        "implicit_meaning": semantic_analysis.implicit_meaning,
-                    }
-                
                 span_start = sent.start_char
                 span_end = sent.end_char
-                candidates.append(
-                    ClaimCandidate(
-                        text=sent_text,
-                        span_start=span_start,
-                        span_end=span_end,
-                        metadata=metadata,
-                    )
+                candidate = ClaimCandidate(
+                    text=sent_text,
+                    span_start=span_start,
+                    span_end=span_end,
+                    metadata=metadata,
                 )
+                candidates.append(candidate)
+                if has_cheap_signal and analyze_sentences:
+                    if len(pending) < self.semantic_max_sentences:
+                        # Use full paragraph context for better understanding
+                        pending.append((candidate, get_paragraph_for_position(sent.start_char)))
+                    else:
+                        over_budget += 1
+
+        if pending:
+            self._apply_semantic_analysis(pending)
+        if over_budget:
+            logger.warning(
+                "Semantic analysis budget of %d sentences reached; %d more flagged sentences "
+                "were scored on keywords only (raise SEMANTIC_ANALYSIS_MAX_SENTENCES to analyze them)",
+                self.semantic_max_sentences,
+                over_budget,
+            )
 
-        # Sort by importance score (most important claims first)
-        candidates.sort(key=lambda x: x.metadata.get("importance_score", 0) if x.metadata else 0, reverse=True)
+        # Sort by importance score (most important claims first); with a cap,
+        # select the top-K from a heap instead of sorting every sentence
+        by_importance = lambda candidate: candidate.metadata["importance_score"]
+        if self.max_claims is not None and len(candidates) > self.max_claims:
+            candidates = heapq.nlargest(self.max_claims, candidates, key=by_importance)
+        else:
+            candidates.sort(key=by_importance, reverse=True)
 
         # Fallback if no good candidates found
         if not candidates and text.strip():
@@ -248,10 +382,17 @@ class SpacyClaimExtractor:
         return candidates
 
 
+@lru_cache(maxsize=1)
+def _get_spacy_extractor() -> SpacyClaimExtractor:
+    """Load the spaCy pipeline and semantic analyzer once per process."""
+    return SpacyClaimExtractor()
+
+
 class SimpleSentenceExtractor:
     """Lightweight extractor that splits text into sentences."""
 
-    sentence_regex = re.compile(r"[^.!?]+[.!?]?", re.MULTILINE | re.DOTALL)
+    # No anchors or dots in the pattern, so it needs no MULTILINE/DOTALL
+    sentence_regex = re.compile(r"[^.!?]+[.!?]?")
 
     def __init__(self, min_length: int = 20):
         self.min_length = min_length
@@ -294,6 +435,20 @@ class SimpleSentenceExtractor:
         return candidates
 
 
+# Texts above this size are decoded straight from a memory map instead of read() into bytes first
+LARGE_TEXT_BYTES = 4 * 1024 * 1024
+
+
+def _read_text(path: Path) -> str:
+    """Read a normalized text file, decoding large files from an mmap to avoid a bytes copy."""
+    with path.open("rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if size <= LARGE_TEXT_BYTES:
+            return handle.read().decode("utf-8")
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return str(mapped, "utf-8")
+
+
 class ClaimService:
     """Coordinates reading document text and persisting extracted claims."""
 
@@ -303,38 +458,57 @@ class ClaimService:
         else:
             settings = get_settings()
             if settings.claim_extractor == "llm":
-                self.extractor = LLMClaimExtractor(
-                    model=settings.openai_model,
-                    api_key=settings.openai_api_key,
-                )
+                self.extractor = _get_llm_extractor(settings.openai_model, settings.openai_api_key)
             elif settings.claim_extractor == "spacy":
-                self.extractor = SpacyClaimExtractor()
+                self.extractor = _get_spacy_extractor()
             else:
                 self.extractor = SimpleSentenceExtractor()
 
     def extract_for_document(self, session: Session, document: Document) -> list[Claim]:
-        if not document.text_path:
-            raise ValueError("Document has no normalized text available for claim extraction.")
-        text_path = Path(document.text_path)
-        text = text_path.read_text(encoding="utf-8")
-
-        session.exec(delete(Claim).where(Claim.document_id == document.id))
-
-        candidates = self.extractor.extract(text)
-        persisted: list[Claim] = []
-        for candidate in candidates:
-            claim = Claim(
-                document_id=document.id,
-                text=candidate.text,
-                span_start=candidate.span_start,
-                span_end=candidate.span_end,
-                metadata_json=candidate.metadata,
-            )
-            session.add(claim)
-            persisted.append(claim)
+        document_id = document.id  # read before the commit expires it
+        return self.extract_for_documents(session, [document])[document_id]
+
+    def extract_for_documents(
+        self, session: Session, documents: list[Document]
+    ) -> dict[str, list[Claim]]:
+        """Re-extract claims for several documents with one batched NLP pass and one commit."""
+        texts = []
+        for document in documents:
+            if not document.text_path:
+                raise ValueError("Document has no normalized text available for claim extraction.")
+            texts.append(_read_text(Path(document.text_path)))
+
+        document_ids = [document.id for document in documents]
+
+        extract_batch = getattr(self.extractor, "extract_batch", None)
+        if extract_batch is not None and len(texts) > 1:
+            batches = extract_batch(texts)
+        else:
+            batches = [self.extractor.extract(text) for text in texts]
+
+        # Replace old claims only once extraction is done, keeping the write transaction short
+        session.exec(
+            delete(Claim)
+            .where(Claim.document_id.in_(document_ids))
+            .execution_options(synchronize_session=False)
+        )
+        persisted: dict[str, list[Claim]] = {}
+        for document_id, candidates in zip(document_ids, batches):
+            persisted[document_id] = [
+                Claim(
+                    document_id=document_id,
+                    text=candidate.text,
+                    span_start=candidate.span_start,
+                    span_end=candidate.span_end,
+                    metadata_json=candidate.metadata,
+                )
+                for candidate in candidates
+            ]
+            session.add_all(persisted[document_id])
         session.commit()
-        for claim in persisted:
-            session.refresh(claim)
+        # Commit expired the new rows; one SELECT repopulates them all in the identity map
+        # instead of a refresh round-trip per claim
+        session.exec(select(Claim).where(Claim.document_id.in_(document_ids))).all()
         return persisted
 
 
@@ -438,3 +612,9 @@ class LLMClaimExtractor:
                 )
             )
         return candidates
+
+
+@lru_cache(maxsize=4)
+def _get_llm_extractor(model: str, api_key: str | None) -> LLMClaimExtractor:
+    """Build the OpenAI-backed extractor once per model/key pair."""
+    return LLMClaimExtractor(model=model, api_key=api_key)
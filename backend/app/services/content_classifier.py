@@ -1,7 +1,17 @@
 """Content classification to detect religious texts, myths, and non-factual content."""
 
-from dataclasses import dataclass
-from typing import Protocol
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Iterable, Protocol
+
+try:  # C Aho-Corasick automaton (pyahocorasick); where it is missing each indicator is checked with `in`
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 
 @dataclass
@@ -15,6 +25,7 @@ class ContentClassification:
     confidence: float  # 0.0-1.0
     content_type: str  # "religious", "mythological", "fiction", "factual", "mixed"
     explanation: str
+    fallback: bool = False  # LLM call failed and the heuristic answered instead
 
 
 class ContentClassifier(Protocol):
@@ -22,6 +33,17 @@ class ContentClassifier(Protocol):
 
     def classify(self, text: str) -> ContentClassification: ...
 
+    def classify_batch(self, texts: list[str]) -> list[ContentClassification]: ...
+
+
+def _build_automaton(phrases: Iterable[str]):
+    """Compile indicator phrases into one automaton that reports every occurrence, overlaps included."""
+    automaton = ahocorasick.Automaton()
+    for phrase in phrases:
+        automaton.add_word(phrase, phrase)
+    automaton.make_automaton()
+    return automaton
+
 
 class HeuristicContentClassifier:
     """Rule-based classifier for religious/mythological content."""
@@ -50,18 +72,33 @@ class HeuristicContentClassifier:
         "ancient story", "creation story", "origin story"
     ]
 
+    # Phrases that mark a creation narrative on their own
+    beginning_phrases = frozenset({"in the beginning", "god created", "and god"})
+
+    _indicators = tuple(religious_indicators + mythological_indicators)
+    _religious = frozenset(religious_indicators)
+    _mythological = frozenset(mythological_indicators)
+    # Both indicator lists are matched in a single pass over the text when pyahocorasick is installed
+    _automaton = _build_automaton(_indicators) if ahocorasick else None
+
+    def _matched_indicators(self, text_lower: str) -> set[str]:
+        """Return the distinct indicator phrases that occur in the (lowercased) text."""
+        if self._automaton is not None:
+            return {phrase for _, phrase in self._automaton.iter(text_lower)}
+        return {phrase for phrase in self._indicators if phrase in text_lower}
+
     def classify(self, text: str) -> ContentClassification:
         """Classify content type using heuristics."""
-        text_lower = text.lower()
+        found = self._matched_indicators(text.lower())
         
         # Check for religious text
-        religious_matches = sum(1 for indicator in self.religious_indicators if indicator in text_lower)
+        religious_matches = len(found & self._religious)
         # More lenient: if we find key phrases like "in the beginning" + "god created", it's likely religious
-        has_beginning_phrase = any(phrase in text_lower for phrase in ["in the beginning", "god created", "and god"])
+        has_beginning_phrase = not self.beginning_phrases.isdisjoint(found)
         is_religious = religious_matches >= 2 or (has_beginning_phrase and religious_matches >= 1)
         
         # Check for mythological content
-        mythological_matches = sum(1 for indicator in self.mythological_indicators if indicator in text_lower)
+        mythological_matches = len(found & self._mythological)
         is_mythological = mythological_matches >= 2
         
         # Determine content type
@@ -88,6 +125,9 @@ class HeuristicContentClassifier:
             explanation=explanation,
         )
 
+    def classify_batch(self, texts: list[str]) -> list[ContentClassification]:
+        return [self.classify(text) for text in texts]
+
 
 class LLMContentClassifier:
     """LLM-based classifier for more accurate detection."""
@@ -109,11 +149,11 @@ class LLMContentClassifier:
         except ImportError:
             raise ImportError("google-generativeai not installed")
 
+    # Texts sent per generate_content call by classify_batch
+    max_batch_size = 16
+
     def classify(self, text: str) -> ContentClassification:
         """Classify content using LLM."""
-        # Sample first 2000 chars for classification
-        sample_text = text[:2000] + ("..." if len(text) > 2000 else "")
-        
         prompt = f"""Classify the following text content. Determine if it is:
 1. Religious text (Bible, Torah, Quran, religious scripture)
 2. Mythological/legendary content
@@ -121,10 +161,58 @@ class LLMContentClassifier:
 4. Factual claims about real events
 
 TEXT:
-{sample_text}
+{_sample(text)}
 
 Respond with JSON:
-{{
+{_RESPONSE_SCHEMA}
+"""
+
+        try:
+            response = self.client.generate_content(prompt)
+            return _classification_from_dict(_parse_json(response.text))
+        except Exception:
+            # Fallback to heuristic
+            classifier = HeuristicContentClassifier()
+            return replace(classifier.classify(text), fallback=True)
+
+    def classify_batch(self, texts: list[str]) -> list[ContentClassification]:
+        """Classify several texts with one request per `max_batch_size` texts."""
+        results: list[ContentClassification] = []
+        for start in range(0, len(texts), self.max_batch_size):
+            results.extend(self._classify_group(texts[start:start + self.max_batch_size]))
+        return results
+
+    def _classify_group(self, texts: list[str]) -> list[ContentClassification]:
+        if len(texts) == 1:
+            return [self.classify(texts[0])]
+
+        documents = "\n\n".join(
+            f"--- DOC {index} ---\n{_sample(text)}" for index, text in enumerate(texts)
+        )
+        prompt = f"""Classify each of the following {len(texts)} texts. For each, determine if it is:
+1. Religious text (Bible, Torah, Quran, religious scripture)
+2. Mythological/legendary content
+3. Historical fiction
+4. Factual claims about real events
+
+{documents}
+
+Respond with a JSON array of exactly {len(texts)} objects, one per DOC in order, each:
+{_RESPONSE_SCHEMA}
+"""
+
+        try:
+            response = self.client.generate_content(prompt)
+            data = _parse_json(response.text)
+            if not isinstance(data, list) or len(data) != len(texts):
+                raise ValueError("Batch response does not match the number of texts")
+            return [_classification_from_dict(entry) for entry in data]
+        except Exception:
+            # Malformed batch answers fall back to one request per text
+            return [self.classify(text) for text in texts]
+
+
+_RESPONSE_SCHEMA = """{
   "is_religious_text": <boolean>,
   "is_mythological": <boolean>,
   "is_historical_fiction": <boolean>,
@@ -132,47 +220,105 @@ Respond with JSON:
   "content_type": "<religious|mythological|fiction|factual|mixed>",
   "confidence": <0.0-1.0>,
   "explanation": "<brief explanation>"
-}}
-"""
+}"""
 
-        try:
-            response = self.client.generate_content(prompt)
-            content = response.text.strip()
-            
-            # Extract JSON
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
-            
-            import json
-            data = json.loads(content)
-            
-            return ContentClassification(
-                is_religious_text=data.get("is_religious_text", False),
-                is_mythological=data.get("is_mythological", False),
-                is_historical_fiction=data.get("is_historical_fiction", False),
-                is_factual_claim=data.get("is_factual_claim", True),
-                confidence=data.get("confidence", 0.5),
-                content_type=data.get("content_type", "factual"),
-                explanation=data.get("explanation", ""),
-            )
-        except Exception:
-            # Fallback to heuristic
-            classifier = HeuristicContentClassifier()
-            return classifier.classify(text)
+
+def _sample(text: str) -> str:
+    """First 2000 chars of a text, which is what the LLM classifies."""
+    return text[:2000] + ("..." if len(text) > 2000 else "")
+
+
+def _parse_json(content: str):
+    """Parse an LLM reply, unwrapping a fenced code block if present."""
+    content = content.strip()
+    if "```json" in content:
+        content = content.split("```json")[1].split("```")[0].strip()
+    elif "```" in content:
+        content = content.split("```")[1].split("```")[0].strip()
+    return json.loads(content)
+
+
+def _classification_from_dict(data: dict) -> ContentClassification:
+    return ContentClassification(
+        is_religious_text=data.get("is_religious_text", False),
+        is_mythological=data.get("is_mythological", False),
+        is_historical_fiction=data.get("is_historical_fiction", False),
+        is_factual_claim=data.get("is_factual_claim", True),
+        confidence=data.get("confidence", 0.5),
+        content_type=data.get("content_type", "factual"),
+        explanation=data.get("explanation", ""),
+    )
+
+
+class CachedContentClassifier:
+    """Memoizes another classifier's results by content hash.
+
+    Classification has no side effects, so repeated text (re-uploads, retries,
+    re-verifying the same claims) is answered from a bounded in-process LRU
+    instead of re-scanning it or making another LLM round-trip.
+    """
+
+    def __init__(self, inner: ContentClassifier, maxsize: int = 4096):
+        self.inner = inner
+        self.maxsize = maxsize
+        self._results: OrderedDict[bytes, ContentClassification] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def classify(self, text: str) -> ContentClassification:
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is not None:
+                self._results.move_to_end(key)
+                return cached
+
+        # Classify outside the lock so concurrent verifications don't queue behind an LLM call
+        result = self.inner.classify(text)
+        self._store({key: result})
+        return result
+
+    def classify_batch(self, texts: list[str]) -> list[ContentClassification]:
+        """Classify texts, sending only distinct uncached ones to the inner classifier in one batch."""
+        keys = [hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest() for text in texts]
+        found: dict[bytes, ContentClassification] = {}
+        missing: dict[bytes, str] = {}
+        with self._lock:
+            for key, text in zip(keys, texts):
+                cached = self._results.get(key)
+                if cached is not None:
+                    self._results.move_to_end(key)
+                    found[key] = cached
+                else:
+                    missing.setdefault(key, text)
+
+        if missing:
+            fresh = dict(zip(missing, self.inner.classify_batch(list(missing.values()))))
+            self._store(fresh)
+            found.update(fresh)
+        return [found[key] for key in keys]
+
+    def _store(self, results: dict[bytes, ContentClassification]) -> None:
+        # Heuristic stand-ins for a failed LLM call are not cached, so the text is retried next time
+        results = {key: result for key, result in results.items() if not result.fallback}
+        with self._lock:
+            self._results.update(results)
+            for key in results:
+                self._results.move_to_end(key)
+            while len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
 
 
+@lru_cache(maxsize=1)
 def create_content_classifier() -> ContentClassifier:
-    """Factory to create appropriate classifier."""
+    """Factory to create appropriate classifier, shared so its result cache persists."""
     from backend.app.core.config import get_settings
     settings = get_settings()
     
     if settings.gemini_api_key:
         try:
-            return LLMContentClassifier()
+            return CachedContentClassifier(LLMContentClassifier())
         except Exception:
             pass
     
-    return HeuristicContentClassifier()
+    return CachedContentClassifier(HeuristicContentClassifier())
 
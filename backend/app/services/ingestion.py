@@ -1,14 +1,32 @@
 """Ingestion orchestration (upload, OCR, normalization)."""
 
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Protocol
+from typing import BinaryIO, Iterable, Iterator, Protocol
 from uuid import uuid4
 
 from backend.app.core.config import get_settings
 from backend.app.db.models import Document
 
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+class UploadTooLargeError(ValueError):
+    """Raised when a streamed upload exceeds the configured size limit."""
+
+    def __init__(self, max_bytes: int):
+        super().__init__(f"Upload exceeds {max_bytes} bytes")
+        self.max_bytes = max_bytes
+
+
 class OCRBackend(Protocol):
     """Behaviour expected from OCR adapters."""
 
@@ -46,6 +64,29 @@ class IngestionService:
         target.write_bytes(file_bytes)
         return target
 
+    def store_raw_stream(
+        self, src: BinaryIO, filename: str, max_bytes: int | None = None
+    ) -> tuple[Path, int]:
+        """Copy an upload to disk in fixed-size chunks, returning (path, size).
+
+        Raises UploadTooLargeError as soon as more than ``max_bytes`` have been
+        read; the partial file is removed.
+        """
+        safe_name = Path(filename or "").name or "upload.bin"
+        target = self.paths.raw_dir / f"{uuid4()}_{safe_name}"
+        size = 0
+        try:
+            with target.open("wb") as dst:
+                while chunk := src.read(UPLOAD_CHUNK_SIZE):
+                    size += len(chunk)
+                    if max_bytes is not None and size > max_bytes:
+                        raise UploadTooLargeError(max_bytes)
+                    dst.write(chunk)
+        except BaseException:
+            target.unlink(missing_ok=True)
+            raise
+        return target, size
+
     def run_ocr(self, source_path: Path, progress_callback=None) -> str:
         if not self.ocr_backend.supports(source_path):
             raise ValueError(f"OCR backend cannot handle {source_path.suffix or 'binary'}")
@@ -129,19 +170,17 @@ class PdfTextOCRBackend:
             return self._extract_with_ocr(input_path, progress_callback)
 
     def _extract_with_ocr(self, input_path: Path, progress_callback=None) -> str:
-        """Extract text from scanned PDF using OCR with progress tracking and batch processing for large docs."""
+        """Extract text from scanned PDF using OCR, one page per task across worker processes."""
         try:
-            from rapidocr_onnxruntime import RapidOCR
-            from pdf2image import convert_from_path
-            import tempfile
-            import os
+            from rapidocr_onnxruntime import RapidOCR  # noqa: F401 - fail fast before starting workers
+            from pdf2image import convert_from_path, pdfinfo_from_path  # noqa: F401
 
             # First, check PDF page count to determine processing strategy
             try:
                 with self._pdfplumber.open(str(input_path)) as pdf:
                     total_pages = len(pdf.pages)
             except Exception:
-                total_pages = None  # Unknown, will process normally
+                total_pages = None  # Ask poppler below
 
             # Hard limit for OCR on extremely large documents
             if total_pages and total_pages > 2000:
@@ -153,83 +192,53 @@ class PdfTextOCRBackend:
             # For very large documents (>500 pages), use aggressive optimizations
             is_very_large = total_pages and total_pages > 500
             dpi = 100 if is_very_large else 150  # Lower DPI for huge docs
-            batch_size = 50 if is_very_large else 200  # Process in smaller batches
             
             if is_very_large and progress_callback:
                 progress_callback(0.0, f"Large document detected ({total_pages} pages). Using optimized processing...")
 
-            ocr = RapidOCR()
             pages_text = []
-
-            # Convert PDF pages to images in batches to save memory
-            with tempfile.TemporaryDirectory() as temp_dir:
+            try:
+                if total_pages is None:
+                    total_pages = pdfinfo_from_path(str(input_path))["Pages"]
+
+                # Pages are independent, so each one is converted and OCR'd in its own task.
+                # Only pages in flight are held as images, and map() keeps page order.
+                # On a GPU one in-process engine (fed by the prefetch thread) beats
+                # loading a copy of the models per worker process
+                default_workers = 1 if _ocr_uses_cuda() else os.cpu_count() or 1
+                workers = get_settings().ocr_workers or default_workers
+                page_numbers = range(1, total_pages + 1)
+                executor = _get_ocr_pool(workers) if workers > 1 and total_pages > 1 else None
+                results = images = None
                 try:
-                    # For very large docs, process page ranges
-                    if is_very_large and total_pages:
-                        # Process in batches to avoid memory issues
-                        for batch_start in range(0, total_pages, batch_size):
-                            batch_end = min(batch_start + batch_size, total_pages)
-                            if progress_callback:
-                                progress_callback(
-                                    batch_start / total_pages,
-                                    f"Converting pages {batch_start+1}-{batch_end} of {total_pages}..."
-                                )
-                            
-                            # Convert batch of pages
-                            images = convert_from_path(
-                                str(input_path),
-                                dpi=dpi,
-                                first_page=batch_start + 1,
-                                last_page=batch_end
-                            )
-                            
-                            # Process this batch
-                            for i, image in enumerate(images):
-                                page_num = batch_start + i
-                                if progress_callback:
-                                    progress_callback(
-                                        page_num / total_pages,
-                                        f"OCR page {page_num+1}/{total_pages}"
-                                    )
-                                
-                                img_path = os.path.join(temp_dir, f"page_{page_num}.png")
-                                image.save(img_path, "PNG")
-                                
-                                result, _ = ocr(img_path)
-                                if result:
-                                    page_text = "\n".join([line[1] for line in result if line[1]])
-                                    pages_text.append(page_text)
-                                
-                                # Clean up immediately
-                                try:
-                                    os.remove(img_path)
-                                except Exception:
-                                    pass
+                    if executor is not None:
+                        results = executor.map(
+                            partial(_ocr_pdf_page, str(input_path), dpi=dpi), page_numbers
+                        )
                     else:
-                        # Normal processing for smaller docs
-                        images = convert_from_path(str(input_path), dpi=dpi)
-                        total_pages = len(images)
-                        
-                        for i, image in enumerate(images):
-                            if progress_callback:
-                                progress_callback(i / total_pages, f"OCR page {i+1}/{total_pages}")
-                            
-                            img_path = os.path.join(temp_dir, f"page_{i}.png")
-                            image.save(img_path, "PNG")
-                            
-                            result, _ = ocr(img_path)
-                            if result:
-                                page_text = "\n".join([line[1] for line in result if line[1]])
-                                pages_text.append(page_text)
-                            
-                            try:
-                                os.remove(img_path)
-                            except Exception:
-                                pass
-                except Exception as e:
-                    if "poppler" in str(e).lower() or "convert" in str(e).lower():
-                        raise ValueError("Could not convert PDF to images. Install poppler: brew install poppler (macOS) or apt-get install poppler-utils (Linux)")
+                        # In-process: render pages on a thread through a small bounded buffer
+                        images = _prefetch(
+                            (_convert_pdf_page(str(input_path), n, dpi) for n in page_numbers),
+                            OCR_PREFETCH_PAGES,
+                        )
+                        results = map(_ocr_page_image, images)
+                    for done, page_text in enumerate(results, start=1):
+                        if progress_callback:
+                            progress_callback(done / total_pages, f"OCR page {done}/{total_pages}")
+                        if page_text is not None:
+                            pages_text.append(page_text)
+                except BrokenProcessPool:
+                    _discard_ocr_pool(executor)
                     raise
+                finally:
+                    if executor is not None and results is not None:
+                        results.close()  # cancels this document's pages still queued in the shared pool
+                    if images is not None:
+                        images.close()  # stops the prefetch thread if OCR failed mid-document
+            except Exception as e:
+                if "poppler" in str(e).lower() or "convert" in str(e).lower():
+                    raise ValueError("Could not convert PDF to images. Install poppler: brew install poppler (macOS) or apt-get install poppler-utils (Linux)")
+                raise
 
             text = "\n\n".join(pages_text).strip()
             if not text:
@@ -244,6 +253,158 @@ class PdfTextOCRBackend:
             raise ValueError(f"OCR extraction failed: {str(e)}")
 
 
+_ocr_engine = None  # RapidOCR engine, created once per process that runs OCR
+_ocr_pool: ProcessPoolExecutor | None = None  # page OCR workers shared by every document
+_ocr_pool_lock = threading.Lock()
+
+
+def _ocr_uses_cuda() -> bool:
+    """Whether OCR should run on the CUDA execution provider (OCR_DEVICE=auto|cpu|cuda)."""
+    device = get_settings().ocr_device.lower()
+    if device == "cpu":
+        return False
+    if device == "cuda":
+        return True
+    try:
+        import onnxruntime
+    except ImportError:
+        return False
+    return "CUDAExecutionProvider" in onnxruntime.get_available_providers()
+
+
+def _get_ocr_engine(**overrides):
+    """Return this process's RapidOCR engine, loading the detection/recognition models once."""
+    global _ocr_engine
+    if _ocr_engine is None:
+        from rapidocr_onnxruntime import RapidOCR
+
+        settings = get_settings()
+        options = {}
+        # Optional replacement models, e.g. int8 copies from scripts/quantize_ocr_models.py
+        for stage in ("det", "cls", "rec"):
+            model_path = getattr(settings, f"ocr_{stage}_model_path")
+            if model_path:
+                options[f"{stage}_model_path"] = model_path
+        if _ocr_uses_cuda():
+            options.update(det_use_cuda=True, cls_use_cuda=True, rec_use_cuda=True)
+        options.update(overrides)
+        _ocr_engine = RapidOCR(**options)
+    return _ocr_engine
+
+
+def _init_ocr_worker() -> None:
+    """Load the engine in an OCR pool process with single-threaded ONNX sessions.
+
+    The pool already runs one page per core; letting every worker's sessions also
+    spread over all cores would oversubscribe the CPU with cores x cores threads.
+    """
+    _get_ocr_engine(intra_op_num_threads=1, inter_op_num_threads=1)
+
+
+def _get_ocr_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the process-wide OCR pool, started on first use with `workers` processes.
+
+    Concurrent documents share it, so scanned PDFs being ingested at once queue their
+    pages for the same workers instead of each starting a pool of their own.
+    """
+    global _ocr_pool
+    with _ocr_pool_lock:
+        if _ocr_pool is None:
+            _ocr_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_ocr_worker,
+            )
+        return _ocr_pool
+
+
+def _discard_ocr_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a pool whose worker died so the next document starts a fresh one."""
+    global _ocr_pool
+    with _ocr_pool_lock:
+        if _ocr_pool is pool:
+            _ocr_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def warm_ocr_engine() -> None:
+    """Load the OCR engine and run one tiny image through it, so CUDA init isn't paid by a request."""
+    import numpy as np
+
+    _get_ocr_engine()(np.full((64, 64, 3), 255, dtype=np.uint8))
+
+# Converted pages buffered ahead of OCR when pages are processed in-process
+OCR_PREFETCH_PAGES = 2
+
+
+def _convert_pdf_page(pdf_path: str, page_number: int, dpi: int):
+    """Render one PDF page (1-based) to a PIL image, or None if poppler returns nothing."""
+    from pdf2image import convert_from_path
+
+    images = convert_from_path(pdf_path, dpi=dpi, first_page=page_number, last_page=page_number)
+    return images[0] if images else None
+
+
+def _ocr_page_image(image) -> str | None:
+    """OCR a rendered page; None when no text is detected."""
+    if image is None:
+        return None
+
+    # RapidOCR takes the PIL image directly (converting it to the BGR array it expects),
+    # so there is no PNG encode/write/read/decode per page
+    result, _ = _get_ocr_engine()(image)
+    if not result:
+        return None
+    return "\n".join([line[1] for line in result if line[1]])
+
+
+def _ocr_pdf_page(pdf_path: str, page_number: int, dpi: int) -> str | None:
+    """Convert and OCR one page; the task run by OCR worker processes."""
+    return _ocr_page_image(_convert_pdf_page(pdf_path, page_number, dpi))
+
+
+_END = object()
+
+
+def _prefetch(items: Iterable, maxsize: int) -> Iterator:
+    """Produce `items` on a background thread, holding at most `maxsize` ready ahead of the consumer.
+
+    Page conversion (a poppler subprocess) and OCR (ONNX runtime) both release the GIL,
+    so rendering the next page overlaps with recognising the current one.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=maxsize)
+    stopped = threading.Event()
+
+    def produce() -> None:
+        try:
+            for item in items:
+                buffer.put(item)
+                if stopped.is_set():
+                    return
+            buffer.put(_END)
+        except BaseException as exc:  # re-raised in the consumer
+            buffer.put(exc)
+
+    producer = threading.Thread(target=produce, name="ocr-page-prefetch", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _END:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stopped.set()
+        # Free a producer blocked on a full buffer so it can see the stop flag and exit
+        while producer.is_alive():
+            try:
+                buffer.get(timeout=0.1)
+            except queue.Empty:
+                pass
+
+
 class ImageOCRBackend:
     """Extracts text from images (screenshots, photos) using OCR."""
 
@@ -251,8 +412,7 @@ class ImageOCRBackend:
 
     def __init__(self) -> None:
         try:
-            from rapidocr_onnxruntime import RapidOCR
-            self.ocr = RapidOCR()
+            self.ocr = _get_ocr_engine()
         except ImportError:
             raise ImportError(
                 "rapidocr-onnxruntime not installed. Install with: poetry add rapidocr-onnxruntime"
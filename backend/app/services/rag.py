@@ -93,6 +93,32 @@ class InMemoryVectorStore:
         return [chunk for _, _, chunk in scored_chunks[:limit]]
 
 
+def _detect_device() -> str:
+    """Pick the fastest available torch device, falling back to CPU."""
+    try:
+        import torch
+    except ImportError:
+        return "cpu"
+    if torch.cuda.is_available():
+        return "cuda"
+    mps = getattr(torch.backends, "mps", None)
+    if mps is not None and mps.is_available():
+        return "mps"
+    return "cpu"
+
+
+def _load_local_model(name: str):
+    """Load a sentence-transformers model on the best device (raises ImportError if missing)."""
+    from sentence_transformers import SentenceTransformer
+
+    device = _detect_device()
+    model = SentenceTransformer(name, device=device)
+    if device == "cuda":
+        # fp16 roughly doubles encode throughput on GPU with negligible accuracy loss
+        model.half()
+    return model
+
+
 class EmbeddingService:
     """Service for generating embeddings. Supports OpenAI API or free local models."""
 
@@ -101,8 +127,7 @@ class EmbeddingService:
         if use_free:
             # Use free local embeddings (sentence-transformers)
             try:
-                from sentence_transformers import SentenceTransformer
-                self.local_model = SentenceTransformer("all-MiniLM-L6-v2")
+                self.local_model = _load_local_model("all-MiniLM-L6-v2")
                 self.model = "all-MiniLM-L6-v2"
             except ImportError:
                 raise ImportError(
@@ -113,8 +138,7 @@ class EmbeddingService:
             if not (api_key or settings.openai_api_key):
                 # Fallback to free if no API key
                 try:
-                    from sentence_transformers import SentenceTransformer
-                    self.local_model = SentenceTransformer("all-MiniLM-L6-v2")
+                    self.local_model = _load_local_model("all-MiniLM-L6-v2")
                     self.model = "all-MiniLM-L6-v2"
                     self.use_free = True
                 except ImportError:
@@ -134,6 +158,30 @@ class EmbeddingService:
             response = self.client.embeddings.create(model=self.model, input=text)
             return response.data[0].embedding
 
+    def embed_batch(self, texts: list[str], batch_size: int = 32) -> list[list[float]]:
+        """Embed many texts, batching similar lengths together to minimise padding."""
+        if not texts:
+            return []
+        # Smart batching: sort by length so each batch pads to a similar size, then unsort
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        ordered = [texts[i] for i in order]
+        if self.use_free:
+            vectors = self.local_model.encode(
+                ordered, batch_size=batch_size, convert_to_numpy=True
+            ).tolist()
+        else:
+            vectors = []
+            for start in range(0, len(ordered), batch_size):
+                response = self.client.embeddings.create(
+                    model=self.model, input=ordered[start:start + batch_size]
+                )
+                vectors.extend(item.embedding for item in response.data)
+
+        results: list[list[float]] = [None] * len(texts)
+        for position, index in enumerate(order):
+            results[index] = vectors[position]
+        return results
+
 
 class EvidenceRetriever:
     """RAG-based evidence retriever."""
@@ -185,7 +233,8 @@ class EvidenceRetriever:
         # Improved chunking: split by paragraphs, but also handle long paragraphs
         paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
         
-        chunks_created = 0
+        # Collect every chunk first so embeddings are computed in one batched pass
+        pending: list[tuple[str, dict]] = []
         for para in paragraphs:
             if len(para) < 50:  # Skip very short paragraphs
                 continue
@@ -204,11 +253,10 @@ class EvidenceRetriever:
                     if not chunk_text.endswith('.'):
                         chunk_text += '.'
                     
-                    embedding = self.embedding_service.embed(chunk_text)
                     # Extract source metadata from filename or default
                     metadata = {
                         "chunk_type": "sentence_window",
-                        "chunk_index": chunks_created,
+                        "chunk_index": len(pending),
                         "reliability_score": 0.8,  # Default reliability for loaded evidence
                     }
                     # Try to infer author/source from filename
@@ -218,23 +266,13 @@ class EvidenceRetriever:
                     elif "encyclopedia" in source_name.lower() or "holocaust" in source_name.lower():
                         metadata["reliability_score"] = 0.95
                     
-                    chunk = DocumentChunk(
-                        text=chunk_text.strip(),
-                        source_name=source_name,
-                        source_uri=str(file_path),
-                        embedding=embedding,
-                        metadata=metadata
-                    )
-                    self.vector_store.add(chunk)
-                    chunks_created += 1
+                    pending.append((chunk_text.strip(), metadata))
             else:
                 # Use paragraph as-is for shorter paragraphs
-                embedding = self.embedding_service.embed(para)
-                
                 # Extract source metadata
                 metadata = {
                     "chunk_type": "paragraph",
-                    "chunk_index": chunks_created,
+                    "chunk_index": len(pending),
                     "reliability_score": 0.8,
                 }
                 if "adl" in source_name.lower():
@@ -243,15 +281,19 @@ class EvidenceRetriever:
                 elif "encyclopedia" in source_name.lower() or "holocaust" in source_name.lower():
                     metadata["reliability_score"] = 0.95
                 
-                chunk = DocumentChunk(
-                    text=para,
+                pending.append((para, metadata))
+
+        embeddings = self.embedding_service.embed_batch([chunk_text for chunk_text, _ in pending])
+        for (chunk_text, metadata), embedding in zip(pending, embeddings):
+            self.vector_store.add(
+                DocumentChunk(
+                    text=chunk_text,
                     source_name=source_name,
                     source_uri=str(file_path),
                     embedding=embedding,
                     metadata=metadata
                 )
-                self.vector_store.add(chunk)
-                chunks_created += 1
+            )
 
 
 def create_default_evidence_retriever() -> EvidenceRetriever:
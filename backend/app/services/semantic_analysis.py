@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Protocol
 
@@ -28,10 +30,17 @@ class SemanticAnalyzer(Protocol):
 
     def analyze(self, text: str, context: str | None = None) -> SemanticAnalysis: ...
 
+    def analyze_batch(
+        self, texts: list[str], contexts: list[str | None] | None = None
+    ) -> list[SemanticAnalysis]: ...
+
 
 class LLMSemanticAnalyzer:
     """Uses LLM to analyze semantic meaning and detect coded antisemitic language."""
 
+    # Requests in flight per analyze_batch call
+    max_concurrency = 8
+
     def __init__(self, api_key: str | None = None, model: str | None = None):
         settings = get_settings()
         self.api_key = api_key or settings.gemini_api_key
@@ -50,6 +59,16 @@ class LLMSemanticAnalyzer:
                 "google-generativeai not installed. Install with: poetry add google-generativeai"
             )
 
+    def analyze_batch(
+        self, texts: list[str], contexts: list[str | None] | None = None
+    ) -> list[SemanticAnalysis]:
+        """Analyze several texts with overlapping requests; results keep input order."""
+        contexts = contexts or [None] * len(texts)
+        if len(texts) <= 1:
+            return [self.analyze(text, context) for text, context in zip(texts, contexts)]
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(texts))) as pool:
+            return list(pool.map(self.analyze, texts, contexts))
+
     def analyze(self, text: str, context: str | None = None) -> SemanticAnalysis:
         """Analyze text for antisemitic content, including coded language and implicit meaning."""
         context_text = f"\n\nContext from surrounding text:\n{context}" if context else ""
@@ -181,48 +200,75 @@ Pay special attention to:
             )
 
 
+def _substring_search(words: tuple[str, ...]):
+    """Compile a keyword list into one alternation; a match means some word is a substring."""
+    return re.compile("|".join(re.escape(word) for word in words)).search
+
+
+# Keyword categories for the heuristic analyzer, matched against lowercased text.
+# Each list is compiled once so a check is a single C-level scan rather than a
+# Python loop of `in` tests per keyword.
+JEWISH_INDICATORS = (
+    "jewish", "jew", "jews", "the jewish", "jewish people", "jewish person",
+    "hanukkah", "hanukah", "hannukah", "kushner",
+    "zionist", "zionism", "judah", "judaism", "hebrew", "israeli",
+)
+CONSPIRACY_KEYWORDS = ("secret", "conspiracy", "plot", "network", "control", "kkk", "klan")
+CONTROL_KEYWORDS = ("control", "dominate", "manipulate", "influence", "run", "own")
+SCAPEGOATING_PHRASES = ("bear responsibility", "to blame", "caused", "responsible for")
+THREAT_INDICATORS = (
+    "war", "threaten", "threatening", "example", "show", "get you", "gone get",
+    "use you", "influence me", "no one can", "imma use", "this is war",
+    "show you", "show the", "told you", "this ain't a game",
+)
+MONEY_TROPE_INDICATORS = (
+    "financial engineering", "making money", "about money", "all about money",
+    "money", "finance", "banking", "financial", "financial gain",
+)
+JEWISH_HOLIDAYS = ("hanukkah", "hanukah", "hannukah", "passover", "yom kippur", "rosh hashanah")
+
+_contains_jewish_indicator = _substring_search(JEWISH_INDICATORS)
+_contains_vague_reference = _substring_search(("they", "them"))
+_contains_blame_word = _substring_search(("control", "influence", "responsible", "blame"))
+_contains_conspiracy_keyword = _substring_search(CONSPIRACY_KEYWORDS)
+_contains_control_keyword = _substring_search(CONTROL_KEYWORDS)
+_contains_scapegoating_phrase = _substring_search(SCAPEGOATING_PHRASES)
+_contains_threat_indicator = _substring_search(THREAT_INDICATORS)
+_contains_influence_word = _substring_search(("influence", "control", "threaten"))
+_contains_money_indicator = _substring_search(MONEY_TROPE_INDICATORS)
+_contains_jewish_holiday = _substring_search(JEWISH_HOLIDAYS)
+
+
 class HeuristicSemanticAnalyzer:
     """Rule-based semantic analyzer (fallback when LLM unavailable)."""
 
+    def analyze_batch(
+        self, texts: list[str], contexts: list[str | None] | None = None
+    ) -> list[SemanticAnalysis]:
+        contexts = contexts or [None] * len(texts)
+        return [self.analyze(text, context) for text, context in zip(texts, contexts)]
+
     def analyze(self, text: str, context: str | None = None) -> SemanticAnalysis:
         """Basic heuristic analysis."""
         text_lower = text.lower()
 
-        # Coded language patterns
-        coded_patterns = [
-            ("they", "them", "those people"),  # Vague references
-            ("international", "global", "network"),  # Conspiracy language
-            ("behind the scenes", "shadow", "secret"),
-            ("control", "influence", "manipulate"),
-        ]
-
         detected = []
         coded_detected = False
 
-        # Define Jewish indicators early (used in multiple checks)
-        # Include variations and common phrases
-        jewish_indicators = [
-            "jewish", "jew", "jews", "the jewish", "jewish people", "jewish person",
-            "hanukkah", "hanukah", "hannukah", "kushner", 
-            "zionist", "zionism", "judah", "judaism", "hebrew", "israeli"
-        ]
+        # Jewish references are used by several checks below, so look them up once
+        has_jewish_reference = _contains_jewish_indicator(text_lower) is not None
 
         # Check for vague references with negative context
-        if any(word in text_lower for word in ["they", "them"]) and any(
-            word in text_lower for word in ["control", "influence", "responsible", "blame"]
-        ):
+        if _contains_vague_reference(text_lower) and _contains_blame_word(text_lower):
             detected.append("coded_language")
             coded_detected = True
 
         # Check for conspiracy patterns
-        conspiracy_keywords = ["secret", "conspiracy", "plot", "network", "control", "kkk", "klan"]
-        if any(word in text_lower for word in conspiracy_keywords):
+        if _contains_conspiracy_keyword(text_lower):
             detected.append("conspiracy_trope")
         
         # Check for antisemitic conspiracy theories (control + Jewish reference)
-        control_keywords = ["control", "dominate", "manipulate", "influence", "run", "own"]
-        has_control_language = any(word in text_lower for word in control_keywords)
-        has_jewish_reference = any(indicator in text_lower for indicator in jewish_indicators)
+        has_control_language = _contains_control_keyword(text_lower) is not None
         
         # If text talks about "controlling" + Jewish people, it's an antisemitic conspiracy trope
         if has_control_language and has_jewish_reference:
@@ -232,24 +278,11 @@ class HeuristicSemanticAnalyzer:
             coded_detected = True
 
         # Check for scapegoating
-        if any(
-            phrase in text_lower
-            for phrase in ["bear responsibility", "to blame", "caused", "responsible for"]
-        ):
+        if _contains_scapegoating_phrase(text_lower):
             detected.append("scapegoating")
 
         # Check for threatening language directed at Jewish people
-        # More comprehensive threat detection
-        threat_indicators = [
-            "war", "threaten", "threatening", "example", "show", "get you", "gone get",
-            "use you", "influence me", "no one can", "imma use", "this is war",
-            "show you", "show the", "told you", "this ain't a game"
-        ]
-        has_threat_language = any(indicator in text_lower for indicator in threat_indicators)
-        
-        # Also check for threatening patterns even without explicit "jewish" if context suggests it
-        # Pattern: threatening language + "jewish" or "jew" anywhere in text
-        has_jewish_reference = any(indicator in text_lower for indicator in jewish_indicators)
+        has_threat_language = _contains_threat_indicator(text_lower) is not None
         
         # Special case: if text has "jewish" + threatening language, it's antisemitic
         # Even if "jewish" appears in a different part of the sentence
@@ -257,23 +290,15 @@ class HeuristicSemanticAnalyzer:
             detected.append("threatening_language")
             coded_detected = True
             # Also mark as conspiracy/control if it mentions "influence" or "control"
-            if any(word in text_lower for word in ["influence", "control", "threaten"]):
+            if _contains_influence_word(text_lower):
                 detected.append("secret_control")
                 if "conspiracy_trope" not in detected:
                     detected.append("conspiracy_trope")
         
-        # Check for money-related antisemitic tropes
-        money_trope_indicators = [
-            "financial engineering", "making money", "about money", "all about money",
-            "money", "finance", "banking", "financial", "financial gain"
-        ]
-        
         # Also check for implicit Jewish references through context
         # If text mentions a Jewish holiday alongside money references, it's likely antisemitic
-        has_jewish_holiday = any(holiday in text_lower for holiday in ["hanukkah", "hanukah", "hannukah", "passover", "yom kippur", "rosh hashanah"])
-        
-        has_money_reference = any(indicator in text_lower for indicator in money_trope_indicators)
-        has_jewish_reference = any(indicator in text_lower for indicator in jewish_indicators)
+        has_jewish_holiday = _contains_jewish_holiday(text_lower) is not None
+        has_money_reference = _contains_money_indicator(text_lower) is not None
         
         # If text mentions money/finance AND Jewish people/holidays, likely money trope
         # Also catch cases where Jewish holiday is mentioned with money references (even if "jewish" not explicitly stated)
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import logging
 import random
 from sqlmodel import Session
 
 from backend.app.db.models import Claim
 from backend.app.services.rag import EvidenceRetriever, EvidenceSnippet
 
+logger = logging.getLogger(__name__)
+
 
 class FreeClaimVerifier:
     """Mock verification service for development/testing (no API costs)."""
@@ -17,6 +20,16 @@ class FreeClaimVerifier:
 
         self.evidence_retriever = evidence_retriever or create_default_evidence_retriever()
 
+    def prepare(self, texts: list[str]) -> None:
+        """Classify a document's claim texts in one batch so verify() finds them cached."""
+        from backend.app.services.content_classifier import create_content_classifier
+
+        try:
+            create_content_classifier().classify_batch(texts)
+        except Exception:
+            # verify() classifies each claim on its own if the batch fails
+            logger.warning("Batch content classification failed for %d claims", len(texts), exc_info=True)
+
     def verify(self, claim: Claim, session: Session) -> Claim:
         """Mock verification that simulates verdicts based on evidence."""
         from backend.app.core.config import get_settings
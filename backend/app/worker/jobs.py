@@ -1,14 +1,18 @@
 """arq worker configuration for ingestion jobs."""
 
+import asyncio
+
+from backend.app.core.config import get_settings
 from backend.app.services.tasks import run_ingestion_job
 
 
 async def ingestion_job(ctx, document_id: str) -> None:
     """Entrypoint executed by the arq worker."""
-    run_ingestion_job(document_id=document_id)
+    # Ingestion blocks (OCR, DB writes); a thread keeps the worker's event loop free
+    # for heartbeats, timeouts and the other concurrent jobs
+    await asyncio.to_thread(run_ingestion_job, document_id=document_id)
 
 
 class WorkerSettings:
     functions = [ingestion_job]
-    max_jobs = 1
-
+    max_jobs = get_settings().ingestion_workers
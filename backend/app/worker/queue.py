@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from functools import lru_cache
 from typing import Protocol
 
 from arq import ArqRedis, create_pool
@@ -15,20 +20,30 @@ class JobQueue(Protocol):
     async def enqueue(self, document_id: str) -> None: ...
 
 
+@lru_cache(maxsize=1)
+def _ingestion_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Shared worker pool for in-process ingestion; extra uploads wait in its FIFO queue."""
+    return concurrent.futures.ThreadPoolExecutor(
+        max_workers=get_settings().ingestion_workers,
+        thread_name_prefix="ingestion",
+    )
+
+
 class SyncJobQueue:
     """Simple queue that runs jobs inline (default dev/test behavior)."""
 
+    # Documents queued or running in this process; enqueueing one of them again is a no-op
+    _pending: set[str] = set()
+    _pending_lock = threading.Lock()
+
     async def enqueue(self, document_id: str) -> None:
         """Enqueue job - run in background thread to avoid blocking."""
-        import asyncio
-        import logging
-        import concurrent.futures
         logger = logging.getLogger(__name__)
-        
-        # Run the sync function in a thread pool to avoid blocking
-        # Use a separate executor to prevent blocking the event loop
-        loop = asyncio.get_event_loop()
-        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        with self._pending_lock:
+            if document_id in self._pending:
+                logger.info(f"Job already queued for document {document_id}")
+                return
+            self._pending.add(document_id)
         
         def run_job():
             try:
@@ -50,9 +65,13 @@ class SyncJobQueue:
                             session.commit()
                 except Exception as db_error:
                     logger.error(f"Failed to update document status: {str(db_error)}")
+            finally:
+                with self._pending_lock:
+                    self._pending.discard(document_id)
         
-        # Fire and forget - don't wait for completion
-        loop.run_in_executor(executor, run_job)
+        # Fire and forget - don't wait for completion. At most INGESTION_WORKERS documents
+        # are processed at once; the rest queue up in the shared executor.
+        asyncio.get_running_loop().run_in_executor(_ingestion_executor(), run_job)
         logger.info(f"Job enqueued (background) for document {document_id}")
 
 
@@ -70,7 +89,8 @@ class ArqJobQueue:
 
     async def enqueue(self, document_id: str) -> None:
         pool = await self._get_pool()
-        await pool.enqueue_job("ingestion_job", document_id=document_id)
+        # The document id doubles as the job id, so arq ignores a repeat enqueue of the same document
+        await pool.enqueue_job("ingestion_job", document_id=document_id, _job_id=document_id)
 
 
 def resolve_job_queue() -> JobQueue:
@@ -49,7 +49,7 @@ Type=simple
 User=$USER
 WorkingDirectory=$APP_DIR
 Environment="PATH=$APP_DIR/.venv/bin:$PATH"
-ExecStart=$HOME/.local/bin/poetry run uvicorn backend.app.main:app --host 0.0.0.0 --port 8000
+ExecStart=$HOME/.local/bin/poetry run uvicorn backend.app.main:app --host 0.0.0.0 --port 8000 --loop uvloop --http httptools
 Restart=always
 RestartSec=10
 
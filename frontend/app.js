@@ -199,14 +199,20 @@ async function showResults(documentId) {
 
     displayResults(results);
 
-    // Load claims
-    const claimsResponse = await fetch(
-      `${API_BASE}/v1/documents/${documentId}/claims`
-    );
-    if (!claimsResponse.ok) throw new Error("Failed to load claims");
-    const claimsData = await claimsResponse.json();
+    // Load claims (paginated)
+    const claims = [];
+    let offset = 0;
+    while (offset !== null) {
+      const claimsResponse = await fetch(
+        `${API_BASE}/v1/documents/${documentId}/claims?offset=${offset}`
+      );
+      if (!claimsResponse.ok) throw new Error("Failed to load claims");
+      const claimsData = await claimsResponse.json();
+      claims.push(...claimsData.items);
+      offset = claimsData.next_offset ?? null;
+    }
 
-    displayClaims(claimsData.items);
+    displayClaims(claims);
   } catch (error) {
     console.error("Error loading results:", error);
     alert(`Error loading results: ${error.message}`);
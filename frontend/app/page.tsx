@@ -64,13 +64,19 @@ export default function Home() {
       const resultsData = await resultsResponse.json();
       setResults(resultsData);
 
-      // Load claims
-      const claimsResponse = await fetch(
-        `${apiBase}/v1/documents/${documentId}/claims`
-      );
-      if (!claimsResponse.ok) throw new Error("Failed to load claims");
-      const claimsData = await claimsResponse.json();
-      setClaims(claimsData.items || []);
+      // Load claims (paginated)
+      const allClaims: any[] = [];
+      let offset: number | null = 0;
+      while (offset !== null) {
+        const claimsResponse = await fetch(
+          `${apiBase}/v1/documents/${documentId}/claims?offset=${offset}`
+        );
+        if (!claimsResponse.ok) throw new Error("Failed to load claims");
+        const claimsData = await claimsResponse.json();
+        allClaims.push(...(claimsData.items || []));
+        offset = claimsData.next_offset ?? null;
+      }
+      setClaims(allClaims);
     } catch (error) {
       console.error("Error loading results:", error);
       alert(
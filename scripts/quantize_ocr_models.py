@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Quantize the RapidOCR detection/classification/recognition models to int8.
+
+Writes int8 copies of the ONNX models bundled with rapidocr-onnxruntime and prints
+the OCR_*_MODEL_PATH settings that point the ingestion service at them.
+
+Usage:
+    python scripts/quantize_ocr_models.py [output_dir]   # default: ./models/ocr-int8
+"""
+
+import sys
+from pathlib import Path
+
+from onnxruntime.quantization import QuantType, quantize_dynamic
+import rapidocr_onnxruntime
+
+MODELS_DIR = Path(rapidocr_onnxruntime.__file__).parent / "models"
+
+# Bundled model file prefix -> setting that selects the model
+STAGES = {
+    "det": "OCR_DET_MODEL_PATH",
+    "cls": "OCR_CLS_MODEL_PATH",
+    "rec": "OCR_REC_MODEL_PATH",
+}
+
+
+def find_model(stage: str) -> Path:
+    candidates = sorted(MODELS_DIR.glob(f"*{stage}*.onnx"))
+    if not candidates:
+        raise SystemExit(f"No {stage} model found in {MODELS_DIR}")
+    return candidates[0]
+
+
+def main() -> None:
+    output_dir = Path(sys.argv[1] if len(sys.argv) > 1 else "models/ocr-int8").resolve()
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    settings = []
+    for stage, setting in STAGES.items():
+        source = find_model(stage)
+        target = output_dir / f"{source.stem}.int8.onnx"
+        print(f"Quantizing {source.name} -> {target}")
+        # Unsigned weights: the CPU provider has no ConvInteger kernel for int8 weights,
+        # and these models are mostly convolutions
+        quantize_dynamic(str(source), str(target), weight_type=QuantType.QUInt8)
+        settings.append(f"{setting}={target}")
+
+    print("\nAdd to your .env:")
+    print("\n".join(settings))
+
+
+if __name__ == "__main__":
+    main()
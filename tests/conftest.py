@@ -6,9 +6,9 @@ os.environ["INGEST_BUCKET_PATH"] = "./data/test-uploads"
 os.environ["PROCESSED_TEXT_PATH"] = "./data/test-processed"
 os.environ["CLAIM_EXTRACTOR"] = "simple"
 
-from backend.app.core.config import get_settings
+from backend.app.core.config import reset_settings
 
-get_settings.cache_clear()
+reset_settings()
 
 import backend.app.db.session as db_session
 
@@ -77,3 +77,42 @@ def test_llm_extractor_with_mock() -> None:
         assert candidates[0].metadata["strategy"] == "llm_openai"
         assert candidates[0].metadata["model"] == "gpt-4o-mini"
 
+
+
+class _BatchingExtractor(SimpleSentenceExtractor):
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    def extract_batch(self, texts: list[str]):
+        self.batches.append(texts)
+        return [self.extract(text) for text in texts]
+
+
+def test_claim_extraction_service_batches_documents(tmp_path: Path) -> None:
+    texts = ["First document states a fact here.", "Second document makes another claim."]
+    with Session(test_engine) as session:
+        documents = []
+        for index, text in enumerate(texts):
+            text_path = tmp_path / f"doc{index}.txt"
+            text_path.write_text(text, encoding="utf-8")
+            documents.append(
+                Document(
+                    title=f"Doc {index}",
+                    source_type="upload",
+                    raw_path=str(text_path),
+                    text_path=str(text_path),
+                    ingest_status="succeeded",
+                )
+            )
+        session.add_all(documents)
+        session.commit()
+        document_ids = [document.id for document in documents]
+
+        extractor = _BatchingExtractor()
+        persisted = ClaimService(extractor).extract_for_documents(session, documents)
+
+        assert extractor.batches == [texts]
+        assert list(persisted) == document_ids
+        for document_id, text in zip(document_ids, texts):
+            assert [claim.text for claim in persisted[document_id]] == [text]
+            assert all(claim.document_id == document_id for claim in persisted[document_id])
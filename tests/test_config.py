@@ -0,0 +1,73 @@
+from pathlib import Path
+
+import pytest
+
+from backend.app.core import config
+from backend.app.core.config import load_settings
+
+KEYS = (
+    "OPENAI_MODEL",
+    "INGESTION_WORKERS",
+    "MAX_CLAIMS_PER_DOCUMENT",
+    "OCR_WORKERS",
+    "STATIC_MAX_AGE",
+    "DEBUG",
+    "DEBUG_STARTUP_FS",
+    "GEMINI_MODEL",
+)
+
+
+@pytest.fixture
+def env_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Point the loader at a temporary .env file and return a writer for it."""
+    for key in KEYS:
+        monkeypatch.delenv(key, raising=False)
+    path = tmp_path / ".env"
+    path.write_text("", encoding="utf-8")
+    monkeypatch.setattr(config, "ENV_FILE", path)
+    config._env_file_values.cache_clear()
+    yield lambda text: path.write_text(text, encoding="utf-8")
+    config._env_file_values.cache_clear()
+
+
+def test_environment_overrides_env_file(env_file, monkeypatch: pytest.MonkeyPatch) -> None:
+    env_file("OPENAI_MODEL=file-model\nINGESTION_WORKERS=3\n")
+    monkeypatch.setenv("OPENAI_MODEL", "env-model")
+
+    settings = load_settings()
+
+    assert settings.openai_model == "env-model"
+    assert settings.ingestion_workers == 3
+
+
+def test_unknown_keys_are_ignored_and_names_match_case_insensitively(
+    env_file, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    env_file("NOT_A_SETTING=1\ngemini_model=lowercase-model\n")
+    monkeypatch.setenv("ALSO_NOT_A_SETTING", "x")
+
+    settings = load_settings()
+
+    assert settings.gemini_model == "lowercase-model"
+    assert not hasattr(settings, "not_a_setting")
+    assert not hasattr(settings, "also_not_a_setting")
+
+
+def test_string_values_are_coerced_to_field_types(env_file, monkeypatch: pytest.MonkeyPatch) -> None:
+    env_file("MAX_CLAIMS_PER_DOCUMENT=50\nSTATIC_MAX_AGE=600\nDEBUG=true\n")
+    monkeypatch.setenv("DEBUG_STARTUP_FS", "0")
+
+    settings = load_settings()
+
+    assert settings.max_claims_per_document == 50
+    assert settings.static_max_age == 600
+    assert settings.debug is True
+    assert settings.debug_startup_fs is False
+    assert settings.ocr_workers is None
+
+
+def test_invalid_values_are_rejected(env_file) -> None:
+    env_file("INGESTION_WORKERS=0\n")
+
+    with pytest.raises(ValueError):
+        load_settings()
@@ -0,0 +1,154 @@
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from backend.app.services import content_classifier
+from backend.app.services.content_classifier import (
+    CachedContentClassifier,
+    HeuristicContentClassifier,
+    LLMContentClassifier,
+)
+
+
+
+@pytest.fixture(params=["automaton", "substring"])
+def heuristic(request, monkeypatch: pytest.MonkeyPatch) -> HeuristicContentClassifier:
+    """Heuristic classifier on the Aho-Corasick path and on the `in` fallback."""
+    if request.param == "automaton":
+        if content_classifier.ahocorasick is None:
+            pytest.skip("pyahocorasick not installed")
+    else:
+        monkeypatch.setattr(HeuristicContentClassifier, "_automaton", None)
+    return HeuristicContentClassifier()
+
+
+def test_heuristic_detects_religious_text(heuristic) -> None:
+    result = heuristic.classify("In the beginning God created the heaven and the earth.")
+    assert result.content_type == "religious"
+    assert result.is_religious_text and not result.is_factual_claim
+
+
+def test_heuristic_detects_mythological_text(heuristic) -> None:
+    result = heuristic.classify("Once upon a time, a legend spoke of a forgotten city.")
+    assert result.content_type == "mythological"
+    assert result.is_mythological and not result.is_religious_text
+    assert result.confidence == pytest.approx(0.8)
+
+
+def test_heuristic_defaults_to_factual(heuristic) -> None:
+    result = heuristic.classify("The city council approved the new budget on Tuesday.")
+    assert result.content_type == "factual"
+    assert result.is_factual_claim
+    assert result.confidence == 0.5
+
+
+def test_heuristic_counts_nested_indicators(heuristic) -> None:
+    # "adam", "eve" and "adam and eve" all match, as with substring checks
+    result = heuristic.classify("Adam and Eve")
+    assert result.content_type == "religious"
+    assert result.confidence == pytest.approx(0.85)
+
+
+def test_heuristic_matches_indicators_inside_words(heuristic) -> None:
+    # "ark" occurs inside "darkness", so the text carries two religious indicators
+    result = heuristic.classify("Darkness fell over the harbour.")
+    assert result.is_religious_text
+    assert result.confidence == pytest.approx(0.8)
+
+
+def test_heuristic_beginning_phrase_needs_only_one_indicator(heuristic) -> None:
+    assert heuristic.classify("And God spoke to the crowd.").is_religious_text
+    # A lone indicator without a beginning phrase is not enough
+    assert not heuristic.classify("He said god said so.").is_religious_text
+
+
+FACTUAL_REPLY = '{"is_factual_claim": true, "content_type": "factual", "confidence": 0.9}'
+
+
+def _llm_classifier(*replies) -> tuple[LLMContentClassifier, MagicMock]:
+    """LLM classifier whose Gemini client returns (or raises) `replies` in order."""
+    client = MagicMock()
+    client.generate_content.side_effect = [
+        reply if isinstance(reply, Exception) else MagicMock(text=reply) for reply in replies
+    ]
+    genai = MagicMock()
+    genai.GenerativeModel.return_value = client
+    google = MagicMock(generativeai=genai)
+    with patch.dict(sys.modules, {"google": google, "google.generativeai": genai}):
+        classifier = LLMContentClassifier(api_key="test-key", model="gemini-test")
+    return classifier, client
+
+
+def test_cache_reuses_llm_answers() -> None:
+    classifier, client = _llm_classifier(FACTUAL_REPLY)
+    cached = CachedContentClassifier(classifier)
+
+    first = cached.classify("The bridge opened in 1932.")
+    second = cached.classify("The bridge opened in 1932.")
+
+    assert first.confidence == 0.9 and not first.fallback
+    assert second is first
+    assert client.generate_content.call_count == 1
+
+
+def test_cache_skips_heuristic_fallback() -> None:
+    classifier, client = _llm_classifier(RuntimeError("quota exceeded"), FACTUAL_REPLY)
+    cached = CachedContentClassifier(classifier)
+
+    first = cached.classify("The bridge opened in 1932.")
+    second = cached.classify("The bridge opened in 1932.")
+
+    assert first.fallback
+    assert not second.fallback and second.confidence == 0.9
+    assert client.generate_content.call_count == 2
+
+RELIGIOUS_REPLY = '{"is_religious_text": true, "is_factual_claim": false, "content_type": "religious"}'
+
+
+def test_llm_batch_matches_array_entries_by_index() -> None:
+    reply = f"```json\n[{RELIGIOUS_REPLY}, {FACTUAL_REPLY}]\n```"
+    classifier, client = _llm_classifier(reply)
+
+    results = classifier.classify_batch(["In the beginning...", "The bridge opened in 1932."])
+
+    assert [result.content_type for result in results] == ["religious", "factual"]
+    assert results[0].is_religious_text and not results[0].is_factual_claim
+    assert client.generate_content.call_count == 1
+    prompt = client.generate_content.call_args.args[0]
+    assert "--- DOC 0 ---\nIn the beginning..." in prompt
+    assert "--- DOC 1 ---\nThe bridge opened in 1932." in prompt
+
+
+def test_llm_batch_short_reply_falls_back_to_single_requests() -> None:
+    classifier, client = _llm_classifier(f"[{FACTUAL_REPLY}]", RELIGIOUS_REPLY, FACTUAL_REPLY)
+
+    results = classifier.classify_batch(["In the beginning...", "The bridge opened in 1932."])
+
+    assert [result.content_type for result in results] == ["religious", "factual"]
+    assert not any(result.fallback for result in results)
+    assert client.generate_content.call_count == 3
+
+
+def test_llm_batch_malformed_reply_falls_back_to_single_requests() -> None:
+    classifier, client = _llm_classifier("Sorry, I can't help with that.", RELIGIOUS_REPLY, FACTUAL_REPLY)
+
+    results = classifier.classify_batch(["In the beginning...", "The bridge opened in 1932."])
+
+    assert [result.content_type for result in results] == ["religious", "factual"]
+    assert client.generate_content.call_count == 3
+
+
+def test_cached_batch_sends_each_distinct_text_once() -> None:
+    classifier, client = _llm_classifier(f"[{RELIGIOUS_REPLY}, {FACTUAL_REPLY}]")
+    cached = CachedContentClassifier(classifier)
+
+    results = cached.classify_batch(["In the beginning...", "The bridge opened in 1932.", "In the beginning..."])
+
+    assert [result.content_type for result in results] == ["religious", "factual", "religious"]
+    assert results[2] is results[0]
+    assert client.generate_content.call_count == 1
+    assert client.generate_content.call_args.args[0].count("In the beginning...") == 1
+    # Both answers are cached now, so a repeat batch makes no request
+    cached.classify_batch(["The bridge opened in 1932.", "In the beginning..."])
+    assert client.generate_content.call_count == 1
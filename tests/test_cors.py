@@ -0,0 +1,30 @@
+from backend.app.core.cors import CachedCORSMiddleware
+
+ORIGINS = ["https://*.vercel.app", "https://app-*.netlify.app", "http://localhost:3000"]
+
+
+def test_origin_matching_covers_exact_suffix_and_regex_rules() -> None:
+    middleware = CachedCORSMiddleware(None, allow_origins=ORIGINS)
+    assert middleware.is_allowed_origin("http://localhost:3000")
+    assert middleware.is_allowed_origin("https://preview-123.vercel.app")
+    assert middleware.is_allowed_origin("https://app-7.netlify.app")
+    assert not middleware.is_allowed_origin("http://preview.vercel.app")
+    assert not middleware.is_allowed_origin("https://vercel.app.evil.com")
+    assert not middleware.is_allowed_origin("https://other.netlify.app")
+
+
+def test_origin_decision_cache_is_bounded() -> None:
+    middleware = CachedCORSMiddleware(None, allow_origins=ORIGINS)
+    middleware.origin_cache_size = 2
+    for origin in ("https://a.vercel.app", "https://b.vercel.app", "https://evil.com"):
+        middleware.is_allowed_origin(origin)
+    assert list(middleware._origin_decisions) == ["https://b.vercel.app", "https://evil.com"]
+
+
+def test_caller_origin_regex_keeps_python_regex_features() -> None:
+    # Lookarounds are valid for Starlette's `re` matching and must not break startup
+    middleware = CachedCORSMiddleware(
+        None, allow_origin_regex=r"https://(?!admin\.)[a-z]+\.example\.com"
+    )
+    assert middleware.is_allowed_origin("https://app.example.com")
+    assert not middleware.is_allowed_origin("https://admin.example.com")
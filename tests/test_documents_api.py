@@ -1,5 +1,10 @@
+import asyncio
 import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from unittest.mock import patch
 
 os.environ["POSTGRES_DSN"] = "sqlite:///./tests/test.db"
 os.environ["INGEST_BUCKET_PATH"] = "./data/test-uploads"
@@ -7,17 +12,20 @@ os.environ["PROCESSED_TEXT_PATH"] = "./data/test-processed"
 os.environ["CLAIM_EXTRACTOR"] = "simple"
 FIXTURES_DIR = Path(__file__).parent
 
-from backend.app.core.config import get_settings
+from backend.app.core.config import reset_settings
 
-get_settings.cache_clear()
+reset_settings()
 
 
 from fastapi.testclient import TestClient
 from sqlmodel import SQLModel, Session, select
 
-from backend.app.db.models import Claim
+from backend.app.db.models import Claim, Document
 from backend.app.db.session import get_engine
 from backend.app.main import app
+from backend.app.routes.documents import get_ingestion_service, get_job_queue
+from backend.app.services.ingestion import IngestionService, PlainTextOCRBackend
+from backend.app.worker.queue import SyncJobQueue
 
 
 def setup_module() -> None:
@@ -38,6 +46,12 @@ def _get_claims(document_id: str) -> list[Claim]:
         return session.exec(select(Claim).where(Claim.document_id == document_id)).all()
 
 
+def _insert(*rows) -> None:
+    with Session(get_engine()) as session:
+        session.add_all(rows)
+        session.commit()
+
+
 def test_healthz() -> None:
     response = client.get("/healthz")
     assert response.status_code == 200
@@ -123,3 +137,148 @@ def test_docx_upload_pipeline() -> None:
     claims = _get_claims(document_id)
     assert claims
 
+
+
+class _SlowAckQueue(SyncJobQueue):
+    """Queue that accepts the job but acknowledges the first enqueue too late."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    async def enqueue(self, document_id: str) -> None:
+        self.calls.append(document_id)
+        await super().enqueue(document_id)
+        if len(self.calls) == 1:
+            await asyncio.sleep(1)
+
+
+def test_upload_enqueue_timeout_retries_without_double_run() -> None:
+    queue = _SlowAckQueue()
+    runs: list[str] = []
+    release = threading.Event()
+
+    def fake_ingestion_job(document_id: str) -> None:
+        runs.append(document_id)
+        release.wait(5)
+
+    app.dependency_overrides[get_job_queue] = lambda: queue
+    app.dependency_overrides[get_ingestion_service] = lambda: IngestionService(PlainTextOCRBackend())
+    try:
+        with patch("backend.app.routes.documents.ENQUEUE_TIMEOUT", 0.05), patch(
+            "backend.app.worker.queue.run_ingestion_job", fake_ingestion_job
+        ):
+            response = client.post(
+                "/v1/documents",
+                files={"file": ("slow.txt", b"slow queue content", "text/plain")},
+            )
+            release.set()
+            deadline = time.monotonic() + 5
+            while SyncJobQueue._pending and time.monotonic() < deadline:
+                time.sleep(0.01)
+    finally:
+        app.dependency_overrides.pop(get_job_queue, None)
+        app.dependency_overrides.pop(get_ingestion_service, None)
+
+    assert response.status_code == 201
+    document_id = response.json()["id"]
+    # The timed-out enqueue is retried after the response, and the retry is a no-op
+    assert queue.calls == [document_id, document_id]
+    assert runs == [document_id]
+
+
+def test_list_claims_pages_in_created_order() -> None:
+    created = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    _insert(Document(id="page-claims-doc", raw_path="page.txt"))
+    # Two claims share a timestamp, so their order falls back to the id
+    _insert(
+        Claim(id="page-claim-z", document_id="page-claims-doc", text="first", created_at=created),
+        Claim(id="page-claim-c", document_id="page-claims-doc", text="third", created_at=created + timedelta(seconds=1)),
+        Claim(id="page-claim-b", document_id="page-claims-doc", text="second b", created_at=created + timedelta(seconds=1)),
+        Claim(id="page-claim-a", document_id="page-claims-doc", text="second a", created_at=created + timedelta(seconds=1)),
+    )
+    url = "/v1/documents/page-claims-doc/claims"
+
+    first = client.get(url, params={"limit": 3}).json()
+    assert [claim["id"] for claim in first["items"]] == ["page-claim-z", "page-claim-a", "page-claim-b"]
+    assert first["next_offset"] == 3
+
+    last = client.get(url, params={"limit": 3, "offset": first["next_offset"]}).json()
+    assert [claim["id"] for claim in last["items"]] == ["page-claim-c"]
+    assert last["next_offset"] is None
+
+    # A page that ends exactly on the last claim has no next page either
+    exact = client.get(url, params={"limit": 4}).json()
+    assert len(exact["items"]) == 4
+    assert exact["next_offset"] is None
+
+
+def test_list_documents_pages_newest_first() -> None:
+    # Far-future timestamps put these documents at the head of the listing
+    created = datetime(2100, 1, 1, tzinfo=timezone.utc)
+    _insert(
+        Document(id="page-doc-old", raw_path="old.txt", created_at=created),
+        Document(id="page-doc-a", raw_path="a.txt", created_at=created + timedelta(days=1)),
+        Document(id="page-doc-b", raw_path="b.txt", created_at=created + timedelta(days=1)),
+    )
+
+    first = client.get("/v1/documents", params={"limit": 2}).json()
+    assert [doc["id"] for doc in first["items"]] == ["page-doc-b", "page-doc-a"]
+    assert first["next_offset"] == 2
+
+    second = client.get("/v1/documents", params={"limit": 1, "offset": 2}).json()
+    assert [doc["id"] for doc in second["items"]] == ["page-doc-old"]
+
+    everything = client.get("/v1/documents", params={"limit": 1000}).json()
+    assert everything["next_offset"] is None
+    total = len(everything["items"])
+    tail = client.get("/v1/documents", params={"limit": 1, "offset": total - 1}).json()
+    assert len(tail["items"]) == 1
+    assert tail["next_offset"] is None
+
+
+def test_document_results_aggregate_mixed_verdicts() -> None:
+    _insert(Document(id="results-doc", raw_path="results.txt"))
+    verdicts = [
+        ("supported", 80.0),
+        ("supported", 90.0),
+        ("partial", 60.0),
+        ("contradicted", 10.0),
+        ("no_evidence", 50.0),
+        # Non-factual and unverified claims are counted but never scored
+        ("not_applicable", 100.0),
+        ("antisemitic_trope", None),
+        (None, 30.0),
+        ("", 5.0),
+    ]
+    _insert(
+        *(
+            Claim(document_id="results-doc", text=f"claim {i}", verdict=verdict, score=score)
+            for i, (verdict, score) in enumerate(verdicts)
+        )
+    )
+
+    response = client.get("/v1/documents/results-doc/results")
+    assert response.status_code == 200
+    results = response.json()
+    assert results["total_claims"] == 9
+    assert results["verified_claims"] == 7
+    assert results["overall_score"] == 58.0
+    assert results["risk_level"] == "medium"
+    assert results["verdict_summary"] == {
+        "supported": 2,
+        "partial": 1,
+        "contradicted": 1,
+        "no_evidence": 1,
+        "not_applicable": 1,
+        "antisemitic_trope": 1,
+        "unverified": 2,
+    }
+
+
+def test_document_results_without_claims() -> None:
+    _insert(Document(id="results-empty-doc", raw_path="empty.txt"))
+
+    results = client.get("/v1/documents/results-empty-doc/results").json()
+    assert results["total_claims"] == 0
+    assert results["overall_score"] is None
+    assert results["risk_level"] == "unknown"
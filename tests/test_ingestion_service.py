@@ -1,3 +1,4 @@
+import io
 from pathlib import Path
 
 import pytest
@@ -8,6 +9,7 @@ from backend.app.services.ingestion import (
     IngestionService,
     PlainTextOCRBackend,
     PdfTextOCRBackend,
+    UploadTooLargeError,
 )
 
 FIXTURES_DIR = Path(__file__).parent
@@ -61,6 +63,20 @@ def test_ingestion_service_raises_for_unsupported(tmp_path: Path) -> None:
         service.run_ocr(sample)
 
 
+def test_store_raw_stream_writes_and_enforces_limit() -> None:
+    service = IngestionService(ocr_backend=PlainTextOCRBackend())
+
+    stored, size = service.store_raw_stream(io.BytesIO(b"hello"), "note.txt", max_bytes=5)
+    assert size == 5
+    assert stored.read_bytes() == b"hello"
+    stored.unlink()
+
+    before = set(service.paths.raw_dir.iterdir())
+    with pytest.raises(UploadTooLargeError):
+        service.store_raw_stream(io.BytesIO(b"too big"), "note.txt", max_bytes=5)
+    assert set(service.paths.raw_dir.iterdir()) == before
+
+
 def test_pdf_backend_reads_fixture() -> None:
     backend = PdfTextOCRBackend()
     pdf_path = FIXTURES_DIR / "hello.pdf"